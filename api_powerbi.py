@@ -51,6 +51,15 @@ from fastapi.responses import JSONResponse
 from loguru import logger
 from pydantic import BaseModel
 
+# orjson serializa los exports grandes (~1.000 filas) varias veces más rápido
+# que el json stdlib; si no está instalado se mantiene JSONResponse
+try:
+    import orjson  # noqa: F401 — ORJSONResponse falla en render() si falta
+    from fastapi.responses import ORJSONResponse
+    _DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    _DEFAULT_RESPONSE_CLASS = JSONResponse
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -189,8 +198,15 @@ def _to_powerbi_row(player: Dict[str, Any]) -> Dict[str, Any]:
 # Lectura del silver
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Cache en proceso del silver parseado: cada endpoint llamaba a _read_silver()
+# y re-parseaba el JSON completo por request, aunque el archivo solo cambia
+# cuando corre POST /sync. Se invalida por (mtime, size) del archivo.
+_SILVER_CACHE: Dict[str, Any] = {"stamp": None, "data": None}
+_SILVER_CACHE_LOCK = threading.Lock()
+
+
 def _read_silver() -> Dict[str, Any]:
-    """Carga silver_data.json. Lanza HTTPException si no existe."""
+    """Carga silver_data.json (cacheado por mtime). Lanza HTTPException si no existe."""
     if not SILVER_PATH.exists():
         raise HTTPException(
             status_code=404,
@@ -200,7 +216,16 @@ def _read_silver() -> Dict[str, Any]:
             ),
         )
     try:
-        return json.loads(SILVER_PATH.read_text(encoding="utf-8-sig"))
+        stat = SILVER_PATH.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with _SILVER_CACHE_LOCK:
+            if _SILVER_CACHE["stamp"] == stamp:
+                return _SILVER_CACHE["data"]
+        data = json.loads(SILVER_PATH.read_text(encoding="utf-8-sig"))
+        with _SILVER_CACHE_LOCK:
+            _SILVER_CACHE["stamp"] = stamp
+            _SILVER_CACHE["data"] = data
+        return data
     except json.JSONDecodeError as exc:
         raise HTTPException(status_code=500, detail=f"JSON corrupto: {exc}") from exc
 
@@ -305,6 +330,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=_DEFAULT_RESPONSE_CLASS,
 )
 
 # CORS — Power BI Desktop realiza requests desde el proceso local
@@ -431,6 +457,7 @@ async def export_players(
     min_score:  Optional[float] = None,
     source:     Optional[str] = None,
     limit:      Optional[int] = None,
+    offset:     int = 0,
 ) -> List[Dict[str, Any]]:
     """
     Devuelve un **array JSON plano** de jugadores en formato Power BI.
@@ -445,6 +472,8 @@ async def export_players(
     - `min_score` — score mínimo (0-10)
     - `source`    — dakgg, wanplus, tec_india, opgg_kr, …
     - `limit`     — máximo de registros (útil para pruebas)
+    - `offset`    — salto inicial; con `limit` permite paginar el dataset
+      en páginas acotadas en vez de un solo payload gigante
 
     ---
     **Cómo conectar Power BI:**
@@ -453,25 +482,30 @@ async def export_players(
     3. URL: `http://127.0.0.1:8000/export/players`
     4. Power BI detectará automáticamente la estructura de columnas
     """
-    silver  = _read_silver()
-    players = [_to_powerbi_row(p) for p in silver.get("players", [])]
+    silver = _read_silver()
+    raw    = silver.get("players", [])
 
-    # Filtros
+    # Filtros — se aplican sobre los campos silver crudos ANTES de mapear a
+    # formato Power BI, para no redondear/formatear filas que se descartan
     if region:
-        r = region.strip().title()
-        players = [p for p in players if p["Region"].lower() == r.lower()]
+        r = region.strip().lower()
+        raw = [p for p in raw if _resolve_region(p).lower() == r]
     if game:
         g = game.strip().upper()
-        players = [p for p in players if p["Game"].upper() == g]
+        raw = [p for p in raw if (p.get("game") or "").upper() == g]
     if min_score is not None:
-        players = [p for p in players if p["Calculated_Score"] >= min_score]
+        raw = [p for p in raw if round(float(p.get("gameradar_score") or 0), 4) >= min_score]
     if source:
         s = source.strip().lower()
-        players = [p for p in players if p["Data_Source"].lower() == s]
+        raw = [p for p in raw if (p.get("_source") or "").lower() == s]
+    # Paginación: recortar la ventana antes de mapear, así cada página
+    # solo formatea limit filas (memoria O(página), no O(dataset))
+    if offset > 0:
+        raw = raw[offset:]
     if limit and limit > 0:
-        players = players[:limit]
+        raw = raw[:limit]
 
-    return players
+    return [_to_powerbi_row(p) for p in raw]
 
 
 @app.get(
@@ -644,6 +678,9 @@ async def benchmark(n: int = 1000) -> Dict[str, Any]:
 
     t_gen_start = time.perf_counter()
 
+    # One timestamp for the whole batch — not one datetime.now() per record
+    silver_ts = datetime.now(timezone.utc).isoformat()
+
     records: List[Dict[str, Any]] = []
     for i in range(max(1, n)):
         score = round(rng.uniform(3.0, 9.8), 4)
@@ -669,7 +706,7 @@ async def benchmark(n: int = 1000) -> Dict[str, Any]:
             "Score_Consistency_Weighted": round(rng.uniform(0.1, 0.3), 4),
             "Data_Source":                rng.choice(_SOURCES),
             "Bronze_Date":                "2026-04-17",
-            "Silver_Timestamp":           datetime.now(timezone.utc).isoformat(),
+            "Silver_Timestamp":           silver_ts,
             "Is_Partial":                 False,
             "Profile_URL":                f"https://example.com/player/{i + 1}",
             "Translations_Applied":       rng.randint(0, 5),
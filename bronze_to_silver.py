@@ -31,9 +31,14 @@ import argparse
 import json
 import math
 import pathlib
+import random
+import re
 import sys
 import time
+from collections import defaultdict
 from datetime import date, datetime, timezone
+from operator import itemgetter
+from statistics import fmean
 from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
@@ -67,6 +72,16 @@ try:
 except ImportError:
     LANGDETECT_AVAILABLE = False
 
+# ──────────────────────────────────────────────────────────────────────────────
+# orjson opcional para los payloads grandes (bronze in / silver out) — mismo
+# patrón que ingestion/ingest_bronze_targets; cae a json stdlib si no está
+# ──────────────────────────────────────────────────────────────────────────────
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Constantes
 # ──────────────────────────────────────────────────────────────────────────────
@@ -110,15 +125,88 @@ W_CONSISTENCY = 0.30
 # Retardo mínimo entre llamadas a Google Translate (ms) — evitar rate-limiting
 TRANSLATE_DELAY_MS = 200
 
+# Reintentos ante rate-limit: backoff exponencial con jitter (1s, 2s, 4s ± 25%)
+TRANSLATE_MAX_RETRIES   = 3
+TRANSLATE_BACKOFF_BASE  = 1.0
+
 # ──────────────────────────────────────────────────────────────────────────────
-# Caché de traducciones — evita llamadas repetidas para el mismo texto
+# Caché de traducciones — evita llamadas repetidas para el mismo texto.
+# Se precarga desde disco al importar: corridas sucesivas sobre los mismos
+# jugadores no repiten ni una llamada a Google Translate (mismo patrón que
+# etl/intelligence). Formato en disco: {lang: {texto: traducción}}.
 # ──────────────────────────────────────────────────────────────────────────────
-_translation_cache: Dict[Tuple[str, str], str] = {}
+_CACHE_PATH = pathlib.Path(__file__).parent / ".translation_cache_silver.json"
+
+
+def _load_disk_cache() -> Dict[Tuple[str, str], str]:
+    """Carga la caché persistida si existe; dict vacío si no o si está corrupta."""
+    try:
+        raw = json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+        return {
+            (text, lang): translation
+            for lang, entries in raw.items()
+            for text, translation in entries.items()
+        }
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_disk_cache() -> None:
+    """Persiste la caché en disco (best-effort: un fallo no corta el pipeline)."""
+    nested: Dict[str, Dict[str, str]] = {}
+    for (text, lang), translation in _translation_cache.items():
+        nested.setdefault(lang, {})[text] = translation
+    try:
+        _CACHE_PATH.write_text(
+            json.dumps(nested, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    except OSError as exc:
+        logger.debug(f"  No se pudo persistir la caché de traducciones — {exc}")
+
+
+_translation_cache: Dict[Tuple[str, str], str] = _load_disk_cache()
+
+# Instancias de GoogleTranslator reutilizadas por idioma origen: construir
+# el traductor por término repite la configuración de sesión/headers cuando
+# con una instancia por idioma alcanza
+_translators: Dict[str, Any] = {}
+
+
+def _get_translator(source_lang: str):
+    """Devuelve (y cachea) el GoogleTranslator para `source_lang` → en."""
+    translator = _translators.get(source_lang)
+    if translator is None:
+        translator = GoogleTranslator(source=source_lang, target="en")
+        _translators[source_lang] = translator
+    return translator
+
+
+# Bloques Unicode por idioma, compilados una vez: una character-class
+# resuelve hangul/kana/devanagari/thai/han en una pasada C, sin pagar el
+# perfil n-gram (Python puro) de langdetect. El kana va antes que el han
+# para que texto japonés con kanji+kana caiga en "ja" y no en "zh-CN".
+_SCRIPT_LANGS: Tuple[Tuple["re.Pattern[str]", str], ...] = (
+    (re.compile("[\uac00-\ud7af\u1100-\u11ff]"), "ko"),     # Hangul
+    (re.compile("[\u3040-\u30ff]"),                "ja"),     # Hiragana / Katakana
+    (re.compile("[\u0900-\u097f]"),                "hi"),     # Devanagari
+    (re.compile("[\u0e00-\u0e7f]"),                "th"),     # Thai
+    (re.compile("[\u4e00-\u9fff]"),                "zh-CN"),  # Han
+)
 
 
 def _detect_language(text: str) -> Optional[str]:
     """Intenta detectar el idioma de un texto. Devuelve código o None."""
-    if not LANGDETECT_AVAILABLE or not text or len(text) < 3:
+    # str.isascii es una pasada C sobre el string: texto puramente ASCII no
+    # necesita ni las character-classes ni langdetect (inglés o ID de jugador)
+    if not text or text.isascii():
+        return None
+
+    # Escrituras con bloque Unicode propio: resolución directa sin langdetect
+    for pattern, lang in _SCRIPT_LANGS:
+        if pattern.search(text):
+            return lang
+
+    if not LANGDETECT_AVAILABLE or len(text) < 3:
         return None
     try:
         return _langdetect(text)
@@ -130,6 +218,8 @@ def _translate_text(text: str, source_lang: str) -> str:
     """
     Traduce `text` desde `source_lang` al inglés usando GoogleTranslator.
     Usa caché interno. Respeta TRANSLATE_DELAY_MS entre llamadas.
+    Ante rate-limit reintenta con backoff exponencial + jitter en lugar de
+    descartar el término (un solo 429 no debe perder la traducción).
     Devuelve el texto original si la traducción falla.
     """
     if not TRANSLATOR_AVAILABLE or not text or not text.strip():
@@ -139,19 +229,26 @@ def _translate_text(text: str, source_lang: str) -> str:
     if cache_key in _translation_cache:
         return _translation_cache[cache_key]
 
-    try:
-        time.sleep(TRANSLATE_DELAY_MS / 1000)
-        translated = GoogleTranslator(source=source_lang, target="en").translate(text)
-        result = translated if translated else text
-        _translation_cache[cache_key] = result
-        return result
-    except TooManyRequests:
-        logger.warning("⚠️  Google Translate rate limit — esperando 5s…")
-        time.sleep(5)
-        return text
-    except (NotValidPayload, RequestError, Exception) as exc:
-        logger.debug(f"  Traducción fallida ({source_lang}→en): '{text[:40]}' — {exc}")
-        return text
+    for attempt in range(TRANSLATE_MAX_RETRIES + 1):
+        try:
+            time.sleep(TRANSLATE_DELAY_MS / 1000)
+            translated = _get_translator(source_lang).translate(text)
+            result = translated if translated else text
+            _translation_cache[cache_key] = result
+            return result
+        except TooManyRequests:
+            if attempt >= TRANSLATE_MAX_RETRIES:
+                logger.warning("⚠️  Google Translate rate limit — reintentos agotados")
+                return text
+            # Jitter ±25% para no sincronizar los reintentos con otros procesos
+            delay = TRANSLATE_BACKOFF_BASE * (2 ** attempt)
+            delay *= random.uniform(0.75, 1.25)
+            logger.warning(f"⚠️  Google Translate rate limit — esperando {delay:.1f}s…")
+            time.sleep(delay)
+        except (NotValidPayload, RequestError, Exception) as exc:
+            logger.debug(f"  Traducción fallida ({source_lang}→en): '{text[:40]}' — {exc}")
+            return text
+    return text
 
 
 def translate_record_fields(record: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
@@ -368,8 +465,11 @@ def load_bronze_records(
 
     for source_name, json_file in files:
         try:
-            # utf-8-sig strips BOM if present, otherwise reads normally
-            data = json.loads(json_file.read_text(encoding="utf-8-sig"))
+            raw_bytes = json_file.read_bytes()
+            # Equivalente a utf-8-sig: descartar BOM si está presente
+            if raw_bytes.startswith(b"\xef\xbb\xbf"):
+                raw_bytes = raw_bytes[3:]
+            data = orjson.loads(raw_bytes) if _HAS_ORJSON else json.loads(raw_bytes)
             if not isinstance(data, list):
                 logger.warning(f"  ⚠️  {json_file}: no es lista — saltando")
                 continue
@@ -478,22 +578,25 @@ def deduplicate(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 def build_summary(silver_records: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Genera métricas de ejecución para el archivo de summary."""
-    by_source: Dict[str, List[float]] = {}
-    for rec in silver_records:
-        src = rec.get("_source", "unknown")
-        score = rec.get("gameradar_score")
-        if score is not None:
-            by_source.setdefault(src, []).append(score)
+    # Un solo sort global antes de agrupar: como el sort es estable, cada
+    # bucket queda ya en orden descendente y el top-3/max/min por fuente
+    # salen por índice, sin re-sortear ni re-escanear cada bucket
+    by_source: Dict[str, List[float]] = defaultdict(list)
+    for rec in sorted(
+        (r for r in silver_records if r.get("gameradar_score") is not None),
+        key=itemgetter("gameradar_score"),
+        reverse=True,
+    ):
+        by_source[rec.get("_source", "unknown")].append(rec["gameradar_score"])
 
     source_stats = {}
     for src, scores in sorted(by_source.items()):
-        scores_sorted = sorted(scores, reverse=True)
         source_stats[src] = {
             "count":    len(scores),
-            "avg_score": round(sum(scores) / len(scores), 4) if scores else 0,
-            "max_score": round(max(scores), 4),
-            "min_score": round(min(scores), 4),
-            "top_3_scores": [round(s, 4) for s in scores_sorted[:3]],
+            "avg_score": round(fmean(scores), 4),
+            "max_score": round(scores[0], 4),
+            "min_score": round(scores[-1], 4),
+            "top_3_scores": [round(s, 4) for s in scores[:3]],
         }
 
     all_scores = [r["gameradar_score"] for r in silver_records if r.get("gameradar_score") is not None]
@@ -503,7 +606,7 @@ def build_summary(silver_records: List[Dict[str, Any]]) -> Dict[str, Any]:
         "total_records":    len(silver_records),
         "sources_covered":  len(by_source),
         "translations_applied": sum(r.get("_translations_applied", 0) for r in silver_records),
-        "avg_gameradar_score": round(sum(all_scores) / len(all_scores), 4) if all_scores else 0,
+        "avg_gameradar_score": round(fmean(all_scores), 4) if all_scores else 0,
         "score_formula":    f"(KDA_norm×{W_KDA}) + (WinRate_norm×{W_WIN_RATE}) + (Consistency_norm×{W_CONSISTENCY})",
         "normalization_note": "Todas las métricas normalizadas a [0,10] antes de ponderar. Score final en [0,10].",
         "by_source":        source_stats,
@@ -551,6 +654,11 @@ def main(
         if i % 10 == 0 or i == len(bronze_records):
             logger.info(f"   {i}/{len(bronze_records)} procesados…")
 
+    # Persistir las traducciones nuevas: la próxima corrida las resuelve
+    # desde disco en microsegundos en vez de repetir llamadas de 50-200 ms
+    if translate and TRANSLATOR_AVAILABLE and total_translations:
+        _save_disk_cache()
+
     # ── 3. Deduplicar ───────────────────────────────────────────────────────
     pre_dedup = len(silver_records)
     silver_records = deduplicate(silver_records)
@@ -572,10 +680,15 @@ def main(
     # ── 6. Guardar ──────────────────────────────────────────────────────────
     if not dry_run:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        if _HAS_ORJSON:
+            # orjson emite UTF-8 directo (sin escapar no-ASCII), igual que
+            # ensure_ascii=False, y serializa en C
+            output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            output_path.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
         logger.success(f"\n💾  Guardado: {output_path}  ({len(silver_records)} jugadores)")
     else:
         logger.info("\n[DRY-RUN] No se escribió silver_data.json")
@@ -1,6 +1,8 @@
 """
 Configuración centralizada de GameRadar AI
 """
+from dataclasses import dataclass
+
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 from typing import Optional
@@ -28,3 +30,22 @@ class Settings(BaseSettings):
 
 # Instancia global de configuración
 settings = Settings()
+
+
+@dataclass(frozen=True, slots=True)
+class _HotConfig:
+    """
+    Snapshot inmutable de los campos leídos en loops calientes.
+    El acceso a atributos de pydantic pasa por descriptores; un dataclass
+    con slots es acceso directo y además no puede mutarse en runtime.
+    """
+    rate_limit_delay: int
+    max_concurrent_requests: int
+    user_agent: str
+
+
+HOT = _HotConfig(
+    rate_limit_delay=settings.rate_limit_delay,
+    max_concurrent_requests=settings.max_concurrent_requests,
+    user_agent=settings.user_agent,
+)
@@ -1,6 +1,7 @@
 """
 Utilidades para detección de país basado en banderas y servidores
 """
+from functools import lru_cache
 from typing import Optional
 import re
 from core.models import CountryCode
@@ -68,22 +69,71 @@ COUNTRY_NAME_TO_CODE = {
 }
 
 
+# Una bandera emoji son exactamente dos "regional indicator symbols"
+# (U+1F1E6..U+1F1FF). En vez de una alternación regex sobre los emojis,
+# convertimos cada par a sus letras ISO-2 y hacemos un lookup O(1) en una
+# tabla precomputada.
+_RI_LO, _RI_HI = 0x1F1E6, 0x1F1FF
+_FLAG_TABLE = {
+    "".join(chr(ord(ch) - _RI_LO + ord("A")) for ch in flag): code
+    for flag, code in FLAG_TO_COUNTRY.items()
+}
+
+# Alternaciones precompiladas: una pasada lineal sobre el texto en vez de
+# K búsquedas de substring (una por patrón). Los nombres se ordenan por
+# longitud para que "south korea" gane sobre "korea" en la misma posición.
+# IGNORECASE en vez de .lower() en el caller: así no se materializa una
+# copia minúscula del texto completo por llamada
+_NAME_RE = re.compile("|".join(
+    re.escape(name) for name in sorted(COUNTRY_NAME_TO_CODE, key=len, reverse=True)
+), re.IGNORECASE)
+
+# Unión banderas+nombres con grupos nombrados: detect_country recorre el
+# texto del perfil UNA vez en lugar de una pasada por banderas y otra por
+# nombres. A igual posición, las banderas (primeras alternativas) ganan.
+_TEXT_GROUP_TO_CODE = {}
+_text_parts = []
+for _i, (_pattern, _code) in enumerate(
+    list(FLAG_TO_COUNTRY.items())
+    + sorted(COUNTRY_NAME_TO_CODE.items(), key=lambda kv: len(kv[0]), reverse=True)
+):
+    _group = f"c{_i}"
+    _text_parts.append(f"(?P<{_group}>{re.escape(_pattern)})")
+    _TEXT_GROUP_TO_CODE[_group] = _code
+_TEXT_RE = re.compile("|".join(_text_parts), re.IGNORECASE)
+del _i, _pattern, _code, _group, _text_parts
+
+
 def detect_country_from_flag(text: str) -> Optional[CountryCode]:
     """
     Detecta país a partir de banderas emoji en el texto
-    
+
     Args:
         text: Texto que puede contener emoji de banderas
-        
+
     Returns:
         CountryCode si se detecta, None si no
     """
-    for flag, country in FLAG_TO_COUNTRY.items():
-        if flag in text:
-            return country
+    # Una pasada sobre los codepoints: cada par consecutivo de regional
+    # indicators se traduce a letras ISO-2 y se busca en la tabla
+    prev = None
+    for ch in text:
+        cp = ord(ch)
+        if _RI_LO <= cp <= _RI_HI:
+            if prev is None:
+                prev = cp
+            else:
+                iso = chr(prev - _RI_LO + ord("A")) + chr(cp - _RI_LO + ord("A"))
+                code = _FLAG_TABLE.get(iso)
+                if code:
+                    return code
+                prev = None  # par consumido; la siguiente bandera arranca limpia
+        else:
+            prev = None
     return None
 
 
+@lru_cache(maxsize=4096)
 def detect_country_from_server(server: str) -> Optional[CountryCode]:
     """
     Detecta país a partir del nombre del servidor
@@ -98,31 +148,35 @@ def detect_country_from_server(server: str) -> Optional[CountryCode]:
     return SERVER_TO_COUNTRY.get(server_lower)
 
 
+# Alternación precompilada: una pasada sobre la URL en vez de 10 tests de
+# substring. El orden de los grupos preserva la prioridad del if/elif.
+_URL_RE = re.compile(
+    r"(?P<KR>/kr/|kr\.op\.gg)|(?P<VN>/vn/|vn\.op\.gg)|"
+    r"(?P<IN>/in/|\.in/)|(?P<CN>/cn/|\.cn/)|(?P<JP>/jp/|\.jp/)",
+    re.IGNORECASE,
+)
+_URL_GROUP_TO_CODE = {
+    "KR": CountryCode.KOREA,
+    "VN": CountryCode.VIETNAM,
+    "IN": CountryCode.INDIA,
+    "CN": CountryCode.CHINA,
+    "JP": CountryCode.JAPAN,
+}
+
+
+@lru_cache(maxsize=4096)
 def detect_country_from_url(url: str) -> Optional[CountryCode]:
     """
     Detecta país a partir de la URL del perfil
-    
+
     Args:
         url: URL del perfil
-        
+
     Returns:
         CountryCode si se detecta, None si no
     """
-    url_lower = url.lower()
-    
-    # Buscar códigos de país en la URL
-    if "/kr/" in url_lower or "kr.op.gg" in url_lower:
-        return CountryCode.KOREA
-    elif "/vn/" in url_lower or "vn.op.gg" in url_lower:
-        return CountryCode.VIETNAM
-    elif "/in/" in url_lower or ".in/" in url_lower:
-        return CountryCode.INDIA
-    elif "/cn/" in url_lower or ".cn/" in url_lower:
-        return CountryCode.CHINA
-    elif "/jp/" in url_lower or ".jp/" in url_lower:
-        return CountryCode.JAPAN
-    
-    return None
+    match = _URL_RE.search(url)
+    return _URL_GROUP_TO_CODE[match.lastgroup] if match else None
 
 
 def detect_country_from_name(text: str) -> Optional[CountryCode]:
@@ -135,15 +189,11 @@ def detect_country_from_name(text: str) -> Optional[CountryCode]:
     Returns:
         CountryCode si se detecta, None si no
     """
-    text_lower = text.lower().strip()
-    
-    for country_name, code in COUNTRY_NAME_TO_CODE.items():
-        if country_name in text_lower:
-            return code
-    
-    return None
+    match = _NAME_RE.search(text)
+    return COUNTRY_NAME_TO_CODE[match.group(0).lower()] if match else None
 
 
+@lru_cache(maxsize=2048)
 def detect_country(
     profile_text: Optional[str] = None,
     server: Optional[str] = None,
@@ -160,70 +210,68 @@ def detect_country(
     4. Texto adicional
     5. UNKNOWN si no se detecta
     
+    Memoizada con lru_cache: en un scrape los argumentos server/url son
+    casi constantes y los textos de perfil se repiten mucho entre filas.
+
     Args:
         profile_text: Texto del perfil del jugador
         server: Nombre del servidor
         url: URL del perfil
         additional_text: Texto adicional para analizar
-        
+
     Returns:
         CountryCode detectado (o UNKNOWN si no se pudo determinar)
     """
-    # Intentar detectar desde bandera
+    # Bandera + nombre de país en una sola pasada sobre el texto
     if profile_text:
-        country = detect_country_from_flag(profile_text)
-        if country:
-            return country
-        
-        # Intentar detectar desde nombre de país
-        country = detect_country_from_name(profile_text)
-        if country:
-            return country
-    
+        match = _TEXT_RE.search(profile_text)
+        if match:
+            return _TEXT_GROUP_TO_CODE[match.lastgroup]
+
     # Intentar detectar desde servidor
     if server:
         country = detect_country_from_server(server)
         if country:
             return country
-    
+
     # Intentar detectar desde URL
     if url:
         country = detect_country_from_url(url)
         if country:
             return country
-    
-    # Intentar detectar desde texto adicional
+
+    # Texto adicional: misma pasada única
     if additional_text:
-        country = detect_country_from_flag(additional_text)
-        if country:
-            return country
-        
-        country = detect_country_from_name(additional_text)
-        if country:
-            return country
-    
+        match = _TEXT_RE.search(additional_text)
+        if match:
+            return _TEXT_GROUP_TO_CODE[match.lastgroup]
+
     # Si no se detectó nada, retornar UNKNOWN
     return CountryCode.UNKNOWN
 
 
+# Región por país: un lookup en vez de la cadena if/elif con listas
+_REGION = {
+    CountryCode.KOREA: "East Asia",
+    CountryCode.JAPAN: "East Asia",
+    CountryCode.CHINA: "Greater China",
+    CountryCode.TAIWAN: "Greater China",
+    CountryCode.INDIA: "South Asia",
+    CountryCode.VIETNAM: "Southeast Asia",
+    CountryCode.PHILIPPINES: "Southeast Asia",
+    CountryCode.THAILAND: "Southeast Asia",
+    CountryCode.INDONESIA: "Southeast Asia",
+}
+
+
 def get_server_region(country: CountryCode) -> str:
     """
     Obtiene la región del servidor basado en el país
-    
+
     Args:
         country: Código del país
-        
+
     Returns:
         Nombre de la región
     """
-    if country in [CountryCode.KOREA, CountryCode.JAPAN]:
-        return "East Asia"
-    elif country in [CountryCode.CHINA, CountryCode.TAIWAN]:
-        return "Greater China"
-    elif country in [CountryCode.INDIA]:
-        return "South Asia"
-    elif country in [CountryCode.VIETNAM, CountryCode.PHILIPPINES, 
-                      CountryCode.THAILAND, CountryCode.INDONESIA]:
-        return "Southeast Asia"
-    else:
-        return "Asia Pacific"
+    return _REGION.get(country, "Asia Pacific")
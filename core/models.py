@@ -157,8 +157,13 @@ class AirtableRecord(BaseModel):
     
     @classmethod
     def from_player_profile(cls, profile: PlayerProfile) -> "AirtableRecord":
-        """Convierte un PlayerProfile a formato Airtable"""
-        return cls(
+        """
+        Convierte un PlayerProfile a formato Airtable.
+
+        Usa model_construct: los campos ya fueron validados al crear el
+        PlayerProfile, re-validarlos aquí duplica el coste por registro.
+        """
+        return cls.model_construct(
             nickname=profile.nickname,
             game=profile.game.value,
             country=profile.country.value,
@@ -26,12 +26,23 @@ import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 import requests
 from loguru import logger
 
+# Optional orjson for the master payload write (same pattern as
+# ingestion/ingest_bronze_targets); falls back to stdlib json.
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Constants
 # ──────────────────────────────────────────────────────────────────────────────
@@ -88,6 +99,10 @@ _DATE_FIELD_PATTERNS = re.compile(
     r"date|created_at|updated_at|timestamp|joined|registered|born", re.I
 )
 
+# Shared HTTP session — reuses the TCP/TLS connection to api.github.com
+# across the dozens of listing/download calls a sync makes.
+_SESSION = requests.Session()
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Logger setup
@@ -112,7 +127,10 @@ def _configure_logger() -> None:
 # GitHub API helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=4)
 def _api_headers(token: str | None) -> dict[str, str]:
+    """Header dict per token, built once — every API call reuses the same
+    mapping instead of reallocating it per request."""
     headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
@@ -122,7 +140,7 @@ def _api_headers(token: str | None) -> dict[str, str]:
 def _api_get(url: str, token: str | None, timeout: int = DOWNLOAD_TIMEOUT_SEC) -> Any:
     """GET from GitHub API with basic error handling and 5-second DoD timing."""
     t0   = time.perf_counter()
-    resp = requests.get(url, headers=_api_headers(token), timeout=timeout)
+    resp = _SESSION.get(url, headers=_api_headers(token), timeout=timeout)
     elapsed = time.perf_counter() - t0
     if elapsed > DOWNLOAD_TIMEOUT_SEC:
         logger.warning(
@@ -139,21 +157,38 @@ def _api_get(url: str, token: str | None, timeout: int = DOWNLOAD_TIMEOUT_SEC) -
     return resp.json()
 
 
-def _list_bronze_sources(repo: str, branch: str, token: str | None) -> list[dict]:
-    """Return list of subdirectory entries under /bronze."""
-    url = f"{GITHUB_API_BASE}/repos/{repo}/contents/{BRONZE_REMOTE_DIR}?ref={branch}"
-    logger.debug(f"Listing bronze sources → {url}")
-    entries = _api_get(url, token)
-    dirs = [e for e in entries if e.get("type") == "dir"]
-    logger.info(f"Found {len(dirs)} source(s) in remote /bronze: {[d['name'] for d in dirs]}")
-    return dirs
-
+def _list_bronze_tree(repo: str, branch: str, token: str | None) -> dict[str, list[dict]]:
+    """
+    List every JSON file under /bronze with ONE Git Trees API call
+    (recursive=1) instead of one Contents call per source directory —
+    the classic 1 + N listing round-trips collapse into a single request.
+    Returns {source_name: [file_entry, …]} with synthesized download_urls.
+    """
+    url = f"{GITHUB_API_BASE}/repos/{repo}/git/trees/{branch}?recursive=1"
+    logger.debug(f"Listing bronze tree → {url}")
+    tree = _api_get(url, token)
+    if tree.get("truncated"):
+        logger.warning("Git tree listing truncated — some bronze files may be missing")
+
+    prefix = BRONZE_REMOTE_DIR + "/"
+    by_source: dict[str, list[dict]] = {}
+    for node in tree.get("tree", []):
+        path = node.get("path", "")
+        if node.get("type") != "blob" or not path.startswith(prefix) or not path.endswith(".json"):
+            continue
+        parts = path.split("/")
+        if len(parts) != 3:  # expect bronze/<source>/<file>.json
+            continue
+        _, source, name = parts
+        by_source.setdefault(source, []).append({
+            "name": name,
+            "path": path,
+            "size": node.get("size"),
+            "download_url": f"{GITHUB_RAW_BASE}/{repo}/{branch}/{path}",
+        })
 
-def _list_source_files(source_entry: dict, repo: str, branch: str, token: str | None) -> list[dict]:
-    """Return list of .json file entries inside a bronze source directory."""
-    url = f"{GITHUB_API_BASE}/repos/{repo}/contents/{source_entry['path']}?ref={branch}"
-    entries = _api_get(url, token)
-    return [e for e in entries if e.get("name", "").endswith(".json")]
+    logger.info(f"Found {len(by_source)} source(s) in remote /bronze: {sorted(by_source)}")
+    return by_source
 
 
 def _download_file(file_entry: dict, token: str | None) -> list[dict]:
@@ -164,7 +199,7 @@ def _download_file(file_entry: dict, token: str | None) -> list[dict]:
     """
     raw_url = file_entry.get("download_url") or file_entry.get("url")
     t0   = time.perf_counter()
-    resp = requests.get(raw_url, headers=_api_headers(token), timeout=DOWNLOAD_TIMEOUT_SEC)
+    resp = _SESSION.get(raw_url, headers=_api_headers(token), timeout=DOWNLOAD_TIMEOUT_SEC)
     elapsed = time.perf_counter() - t0
     if elapsed > DOWNLOAD_TIMEOUT_SEC:
         logger.warning(
@@ -449,12 +484,14 @@ def _dedup_key(record: dict, source: str) -> str:
 def deduplicate(
     new_records: dict[str, list[dict]],
     existing_records: list[dict],
-) -> tuple[list[dict], int, int]:
+) -> tuple[list[dict], list[dict], int]:
     """
     Merge new_records (by source) with existing_records (already-synced list).
     Players already present in existing are skipped.
 
-    Returns (merged_list, new_count, duplicate_count).
+    Returns (merged_list, genuinely_new_records, duplicate_count).
+    The new records are returned separately so downstream steps can process
+    only them instead of re-walking the whole master on every sync.
     """
     seen: set[str] = set()
     merged: list[dict] = []
@@ -465,7 +502,8 @@ def deduplicate(
         seen.add(key)
         merged.append(rec)
 
-    new_count = dup_count = 0
+    new: list[dict] = []
+    dup_count = 0
 
     for source, records in new_records.items():
         for rec in records:
@@ -477,9 +515,9 @@ def deduplicate(
             seen.add(key)
             rec["_source"] = source
             merged.append(rec)
-            new_count += 1
+            new.append(rec)
 
-    return merged, new_count, dup_count
+    return merged, new, dup_count
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -520,7 +558,12 @@ def write_master_rookie(players: list[dict], output: pathlib.Path) -> None:
         "players": players,
     }
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    if _HAS_ORJSON:
+        # orjson writes UTF-8 directly (no ASCII escaping), matching
+        # ensure_ascii=False, with C-speed encoding
+        output.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        output.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     logger.success(f"Written → {output}  ({len(players)} players)")
 
 
@@ -538,34 +581,36 @@ def download_via_api(
     Returns {source_name: [record, …]}.
     """
     logger.info(f"Connecting to GitHub API → {repo} (branch: {branch})")
-    sources = _list_bronze_sources(repo, branch, token)
+    files_by_source = _list_bronze_tree(repo, branch, token)
 
     result: dict[str, list[dict]] = {}
     total_files = total_records = 0
 
-    for src_entry in sources:
-        source = src_entry["name"]
-        logger.info(f"  ↓  Fetching source: {source}")
-
-        files = _list_source_files(src_entry, repo, branch, token)
-        if not files:
-            logger.warning(f"    No JSON files found in /bronze/{source} — skipping")
-            continue
-
-        # Only download the most-recent file (lexicographically last by filename = latest date)
-        latest = sorted(files, key=lambda f: f["name"])[-1]
-        logger.debug(f"    Latest file: {latest['name']} ({latest.get('size', '?')} bytes)")
+    # Only download the most-recent file per source (lexicographically last
+    # by filename = latest date)
+    latest_by_source = {
+        source: max(files, key=itemgetter("name"))
+        for source, files in files_by_source.items()
+    }
 
-        try:
-            records = _download_file(latest, token)
-            logger.info(f"    ✓  {len(records):3d} record(s) from {latest['name']}")
-            result[source] = records
-            total_files   += 1
-            total_records += len(records)
-            # Be a good citizen: small delay between requests
-            time.sleep(0.3)
-        except Exception as exc:
-            logger.error(f"    ✗  Failed to download {latest['name']}: {exc}")
+    # Las descargas son independientes entre sí: en paralelo el tiempo total
+    # es ~max(latencias) en vez de sum(latencias) + sleeps de cortesía
+    with ThreadPoolExecutor(max_workers=min(4, len(latest_by_source) or 1)) as pool:
+        futures = {
+            pool.submit(_download_file, entry, token): source
+            for source, entry in sorted(latest_by_source.items())
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            latest = latest_by_source[source]
+            try:
+                records = future.result()
+                logger.info(f"  ✓  [{source}] {len(records):3d} record(s) from {latest['name']}")
+                result[source] = records
+                total_files   += 1
+                total_records += len(records)
+            except Exception as exc:
+                logger.error(f"  ✗  [{source}] Failed to download {latest['name']}: {exc}")
 
     logger.success(
         f"GitHub API download complete — "
@@ -653,7 +698,8 @@ def main() -> int:
     logger.info("STEP 3 — Deduplicate")
     logger.info("=" * 60)
 
-    merged, new_count, dup_count = deduplicate(raw_by_source, existing)
+    merged, new_records, dup_count = deduplicate(raw_by_source, existing)
+    new_count = len(new_records)
     logger.info(f"Dedup result: {new_count} new, {dup_count} duplicate(s), {len(merged)} total")
 
     # ── STEP 4: Normalise units ───────────────────────────────────────────────
@@ -662,18 +708,23 @@ def main() -> int:
     logger.info("STEP 4 — Normalise game times & dates")
     logger.info("=" * 60)
 
-    processed: list[dict] = []
+    # Solo los registros nuevos: los del master existente ya fueron
+    # normalizados en el run que los escribió — re-caminarlos todos cada
+    # sync es trabajo O(master) repetido que crece con cada ejecución.
+    processed_new: list[dict] = []
     time_changes_total = date_changes_total = 0
 
-    for rec in merged:
+    for rec in new_records:
         rec, tc = normalize_game_times(rec)
         rec, dc = normalize_dates(rec)
         time_changes_total += tc
         date_changes_total += dc
-        processed.append(rec)
+        processed_new.append(rec)
+
+    processed = existing + processed_new
 
     logger.info(
-        f"Normalisation complete — "
+        f"Normalisation complete — {len(processed_new)} new record(s), "
         f"{time_changes_total} time field(s), {date_changes_total} date field(s) converted"
     )
 
@@ -683,10 +734,13 @@ def main() -> int:
     logger.info("STEP 5 — Compute Activity_Level for each player")
     logger.info("=" * 60)
 
+    # Registros existentes conservan su activity_level; solo se calcula
+    # para los nuevos (o para masters antiguos sin el campo)
     for rec in processed:
-        rec["activity_level"] = compute_activity_level(rec)
+        if "activity_level" not in rec:
+            rec["activity_level"] = compute_activity_level(rec)
 
-    by_level = sorted(processed, key=lambda r: r["activity_level"], reverse=True)
+    by_level = sorted(processed, key=itemgetter("activity_level"), reverse=True)
     for rec in by_level:
         marker = "✓" if rec["activity_level"] > args.threshold else "✗"
         logger.info(
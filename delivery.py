@@ -47,6 +47,7 @@ import smtplib
 import sys
 import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email import encoders
 from email.mime.base import MIMEBase
@@ -307,6 +308,10 @@ def generate_region_pdfs(
     Generate one PDF per unique region found in the subscriber list.
     Returns a mapping of region_plan → pdf_path (None if generation failed).
     Uses WeasyPrint via generate_rookie_report.generate().
+
+    Regions not covered by a cached PDF are rendered in parallel worker
+    threads: each generate() call writes to its own output path and builds
+    its own Jinja2 environment, so the renders are independent of each other.
     """
     unique_regions = {s.region_plan for s in subscribers}
     if filter_region:
@@ -315,6 +320,8 @@ def generate_region_pdfs(
     region_pdf: dict[str, pathlib.Path | None] = {}
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
+    pending: list[tuple[str, dict, pathlib.Path]] = []
+
     for region_plan in sorted(unique_regions):
         cfg       = _region_cfg(region_plan)
         pdf_name  = _pdf_filename(cfg["slug"], report_month)
@@ -335,6 +342,19 @@ def generate_region_pdfs(
             region_pdf[region_plan] = None
             continue
 
+        pending.append((region_plan, cfg, pdf_path))
+
+    # The load → normalise → score pipeline depends only on the data source,
+    # not on the region: run it once and share the result across all regions
+    # instead of re-scoring the same dataset per PDF.
+    shared_players: list[dict] | None = None
+    if pending:
+        try:
+            shared_players = _grr.load_scored_players("master")
+        except Exception as exc:
+            logger.warning(f"Could not pre-score players once for all regions: {exc}")
+
+    def _generate_one(region_plan: str, cfg: dict, pdf_path: pathlib.Path) -> pathlib.Path | None:
         logger.info(f"Generating report for region: {cfg['label']} → {pdf_path.name}")
         try:
             _grr.generate(
@@ -345,19 +365,33 @@ def generate_region_pdfs(
                 top_n        = cfg["top_n"],
                 auto_open    = False,
                 html_only    = False,
+                players      = shared_players,
             )
-            region_pdf[region_plan] = pdf_path if pdf_path.exists() else None
+            return pdf_path if pdf_path.exists() else None
         except SystemExit as exc:
             logger.error(
                 f"Report generation failed for '{region_plan}' "
                 f"(SystemExit {exc.code}) — skipping region"
             )
-            region_pdf[region_plan] = None
+            return None
         except Exception as exc:
             logger.error(
                 f"Unexpected error generating report for '{region_plan}': {exc}"
             )
-            region_pdf[region_plan] = None
+            return None
+
+    if len(pending) == 1:
+        # Una sola región: evitar el coste de levantar el pool
+        region_plan, cfg, pdf_path = pending[0]
+        region_pdf[region_plan] = _generate_one(region_plan, cfg, pdf_path)
+    elif pending:
+        with ThreadPoolExecutor(max_workers=min(4, len(pending))) as pool:
+            futures = {
+                region_plan: pool.submit(_generate_one, region_plan, cfg, pdf_path)
+                for region_plan, cfg, pdf_path in pending
+            }
+            for region_plan, future in futures.items():
+                region_pdf[region_plan] = future.result()
 
     return region_pdf
 
@@ -570,10 +604,50 @@ _MAX_RETRIES    = 3
 _RETRY_BASE_SEC = 2.0   # exponential: 2s, 4s, 8s
 
 
+class _SmtpSession:
+    """
+    Persistent SMTP connection shared across the delivery loop.
+
+    Opening a fresh connection per email costs a TCP + TLS handshake plus an
+    authenticated login every time; one session amortises that to a single
+    handshake per run. The connection is opened lazily, dropped on transport
+    errors (the next send reconnects) and closed once delivery finishes.
+    """
+
+    def __init__(self, config: SmtpConfig):
+        self.config = config
+        self._conn: smtplib.SMTP | None = None
+
+    def _ensure(self) -> smtplib.SMTP:
+        if self._conn is None:
+            cfg = self.config
+            if cfg.use_ssl:
+                conn = smtplib.SMTP_SSL(cfg.host, cfg.port, timeout=30)
+            else:
+                conn = smtplib.SMTP(cfg.host, cfg.port, timeout=30)
+                conn.ehlo()
+                conn.starttls()
+                conn.ehlo()
+            conn.login(cfg.user, cfg.password)
+            self._conn = conn
+        return self._conn
+
+    def send(self, to: str, payload: bytes) -> None:
+        self._ensure().sendmail(self.config.from_addr, [to], payload)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._conn = None
+
+
 def _send_one(
     msg:     MIMEMultipart,
     to:      str,
-    config:  SmtpConfig,
+    session: _SmtpSession,
     *,
     dry_run: bool = False,
 ) -> tuple[bool, str]:
@@ -588,21 +662,11 @@ def _send_one(
     last_error = ""
     for attempt in range(1, _MAX_RETRIES + 1):
         try:
-            if config.use_ssl:
-                conn = smtplib.SMTP_SSL(config.host, config.port, timeout=30)
-            else:
-                conn = smtplib.SMTP(config.host, config.port, timeout=30)
-                conn.ehlo()
-                conn.starttls()
-                conn.ehlo()
-
-            conn.login(config.user, config.password)
-            conn.sendmail(config.from_addr, [to], msg.as_bytes())
-            conn.quit()
+            session.send(to, msg.as_bytes())
             return True, ""
 
         except smtplib.SMTPRecipientsRefused as exc:
-            # Permanent failure — no point retrying
+            # Permanent failure — no point retrying (connection stays usable)
             last_error = f"Recipient refused: {exc.recipients}"
             logger.warning(f"Permanent SMTP failure for {to}: {last_error}")
             return False, last_error
@@ -615,6 +679,9 @@ def _send_one(
 
         except (smtplib.SMTPException, OSError) as exc:
             last_error = str(exc)
+            # Transport-level error: drop the connection so the retry
+            # (and subsequent sends) reconnect cleanly
+            session.close()
             wait = _RETRY_BASE_SEC * (2 ** (attempt - 1))
             if attempt < _MAX_RETRIES:
                 logger.warning(
@@ -739,6 +806,9 @@ def deliver(
     fail_count  = 0
     skip_count  = 0
 
+    # Una sola conexión SMTP para todo el lote (handshake TLS + login una vez)
+    smtp_session = _SmtpSession(smtp_config) if smtp_config else None
+
     try:
         for idx, sub in enumerate(subscribers, start=1):
             cfg      = _region_cfg(sub.region_plan)
@@ -784,7 +854,7 @@ def deliver(
             )
 
             try:
-                success, error_msg = _send_one(msg, sub.email, smtp_config)
+                success, error_msg = _send_one(msg, sub.email, smtp_session)
             except smtplib.SMTPAuthenticationError:
                 # Auth failure is fatal — abort remaining sends
                 logger.error(
@@ -815,6 +885,8 @@ def deliver(
                 time.sleep(send_delay_s)
 
     finally:
+        if smtp_session:
+            smtp_session.close()
         log_fh.flush()
         log_fh.close()
 
@@ -41,7 +41,9 @@ Public API
 
 from __future__ import annotations
 
+import json
 import math
+import pathlib
 import time
 from typing import NamedTuple
 
@@ -75,12 +77,79 @@ except ImportError:
 # Minimum delay between Google Translate calls (seconds)
 _TRANSLATE_DELAY = 0.20
 
-# In-process cache to avoid repeated API calls for the same (text, lang) pair
-_translation_cache: dict[tuple[str, str], str] = {}
+# Cache of translations keyed by (text, lang). Warmed from disk at import so
+# re-runs over the same players cost zero API calls; Google Translate results
+# for fixed terms are deterministic enough to persist indefinitely.
+_CACHE_PATH = pathlib.Path(__file__).parent / ".translation_cache.json"
+
+
+def _load_disk_cache() -> dict[tuple[str, str], str]:
+    """Load the persisted cache ({lang: {text: translation}}) if present."""
+    try:
+        raw = json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+        return {
+            (text, lang): translation
+            for lang, entries in raw.items()
+            for text, translation in entries.items()
+        }
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_disk_cache() -> None:
+    """Persist the in-process cache back to disk (best-effort)."""
+    nested: dict[str, dict[str, str]] = {}
+    for (text, lang), translation in _translation_cache.items():
+        nested.setdefault(lang, {})[text] = translation
+    try:
+        _CACHE_PATH.write_text(
+            json.dumps(nested, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    except OSError as exc:
+        logger.debug(f"  CACHE could not persist translation cache — {exc}")
+
+
+_translation_cache: dict[tuple[str, str], str] = _load_disk_cache()
+
+# GoogleTranslator instances reused per source language — constructing one
+# per term repeats session/header setup that a per-language instance amortises
+_translators: dict[str, object] = {}
+
+
+def _get_translator(source_lang: str):
+    """Return (and cache) the GoogleTranslator for `source_lang` → en."""
+    translator = _translators.get(source_lang)
+    if translator is None:
+        translator = GoogleTranslator(source=source_lang, target="en")
+        _translators[source_lang] = translator
+    return translator
+
 
 # Languages that use non-ASCII scripts → primary candidates for translation
 _ASIAN_LANG_CODES: set[str] = {"zh-CN", "zh-TW", "zh", "ko", "ja", "hi", "th", "vi"}
 
+# Record fields eligible for translation
+_TRANSLATABLE = ("role", "rank", "team")
+
+# Batch-prefetch packing limits: Google Translate rejects oversized payloads
+# (~5000 chars per request), so packs are bounded by terms and total length
+_BATCH_MAX_TERMS = 50
+_BATCH_MAX_CHARS = 4500
+
+
+def _pack_terms(terms: list[str]):
+    """Yield sub-batches of `terms` bounded by count and total characters."""
+    pack: list[str] = []
+    chars = 0
+    for term in terms:
+        if pack and (len(pack) >= _BATCH_MAX_TERMS or chars + len(term) > _BATCH_MAX_CHARS):
+            yield pack
+            pack, chars = [], 0
+        pack.append(term)
+        chars += len(term)
+    if pack:
+        yield pack
+
 # Country → most likely language (used when text is too short for langdetect)
 COUNTRY_TO_LANG: dict[str, str] = {
     "CN": "zh-CN",
@@ -554,19 +623,19 @@ def translate_esports_term(text: str, source_lang: str) -> str:
     lang_map = TECHNICAL_MAPPING.get(source_lang, {})
     if text_stripped in lang_map:
         result = lang_map[text_stripped]
-        logger.debug(f"  DICT  [{source_lang}] '{text_stripped}' → '{result}'")
+        logger.debug("  DICT  [{}] '{}' → '{}'", source_lang, text_stripped, result)
         return result
 
     # Case-insensitive fallback within the same language map
     lower = text_stripped.lower()
     for native, canonical in lang_map.items():
         if native.lower() == lower:
-            logger.debug(f"  DICT~ [{source_lang}] '{text_stripped}' → '{canonical}'")
+            logger.debug("  DICT~ [{}] '{}' → '{}'", source_lang, text_stripped, canonical)
             return canonical
 
     # ── Tier 2: Google Translate ──────────────────────────────────────────────
     if not _TRANSLATOR_AVAILABLE:
-        logger.debug(f"  MISS  [{source_lang}] '{text_stripped}' — no translator available")
+        logger.debug("  MISS  [{}] '{}' — no translator available", source_lang, text_stripped)
         return text_stripped
 
     cache_key = (text_stripped, source_lang)
@@ -575,20 +644,78 @@ def translate_esports_term(text: str, source_lang: str) -> str:
 
     try:
         time.sleep(_TRANSLATE_DELAY)
-        translated = GoogleTranslator(source=source_lang, target="en").translate(text_stripped)
+        translated = _get_translator(source_lang).translate(text_stripped)
         result = translated.strip() if translated else text_stripped
         _translation_cache[cache_key] = result
-        logger.debug(f"  API   [{source_lang}] '{text_stripped}' → '{result}'")
+        logger.debug("  API   [{}] '{}' → '{}'", source_lang, text_stripped, result)
         return result
     except TooManyRequests:
         logger.warning(f"  LIMIT Google Translate rate limit — waiting 5 s …")
         time.sleep(5)
         return text_stripped
     except (NotValidPayload, RequestError, Exception) as exc:
-        logger.debug(f"  FAIL  [{source_lang}] '{text_stripped}' — {exc}")
+        logger.debug("  FAIL  [{}] '{}' — {}", source_lang, text_stripped, exc)
         return text_stripped
 
 
+def _effective_lang(value: str, country_lang: str | None) -> str | None:
+    """Resolve the source language for a value: country mapping first,
+    langdetect fallback. Returns None when no Asian language is evident."""
+    if country_lang is not None:
+        return country_lang
+    if _LANGDETECT_AVAILABLE:
+        try:
+            detected = _langdetect(value)
+            if detected in _ASIAN_LANG_CODES:
+                return detected
+        except LangDetectException:
+            pass
+    return None
+
+
+def _prefetch_translations(records: list[dict]) -> None:
+    """
+    Bulk Tier-2 prefetch: collect every (term, lang) pair that would fall
+    through to Google Translate, deduplicate, and resolve them with one
+    `translate_batch` call per source language instead of one HTTP round-trip
+    (plus rate-limit sleep) per term. Results land in `_translation_cache`,
+    so the subsequent per-record pass is pure dict lookups.
+    """
+    # dict como set ordenado: dedup O(1) por término, muchos jugadores
+    # comparten exactamente el mismo role/rank/team
+    by_lang: dict[str, dict[str, None]] = {}
+    for record in records:
+        country_lang = COUNTRY_TO_LANG.get(record.get("country", "XX"))
+        for field in _TRANSLATABLE:
+            value = record.get(field)
+            if not isinstance(value, str) or not value.strip() or value.isascii():
+                continue
+            text = value.strip()
+            lang = _effective_lang(text, country_lang)
+            if lang is None or (text, lang) in _translation_cache:
+                continue
+            lang_map = TECHNICAL_MAPPING.get(lang, {})
+            # Tier 1 resolves these without the API — don't prefetch them
+            if text in lang_map or text.lower() in (n.lower() for n in lang_map):
+                continue
+            by_lang.setdefault(lang, {})[text] = None
+
+    for lang, unique_terms in by_lang.items():
+        translator = _get_translator(lang)
+        for pack in _pack_terms(list(unique_terms)):
+            try:
+                time.sleep(_TRANSLATE_DELAY)
+                results = translator.translate_batch(pack)
+                for term, result in zip(pack, results):
+                    _translation_cache[(term, lang)] = result.strip() if result else term
+                logger.debug(f"  BATCH [{lang}] {len(pack)} terms prefetched in one call")
+            except TooManyRequests:
+                logger.warning(f"  LIMIT batch prefetch [{lang}] rate-limited — falling back to per-term")
+                time.sleep(5)
+            except (NotValidPayload, RequestError, Exception) as exc:
+                logger.debug(f"  FAIL  batch prefetch [{lang}] — {exc}")
+
+
 def translate_player_record(record: dict) -> dict:
     """
     Translate all esports-relevant text fields of a bronze/silver player record
@@ -609,8 +736,6 @@ def translate_player_record(record: dict) -> dict:
     country = record.get("country", "XX")
     lang = COUNTRY_TO_LANG.get(country)
 
-    _TRANSLATABLE = ("role", "rank", "team")
-
     for field in _TRANSLATABLE:
         value = record.get(field)
         if not isinstance(value, str) or not value.strip():
@@ -621,17 +746,9 @@ def translate_player_record(record: dict) -> dict:
             continue
 
         # Detect language if not deterministic from country code
-        effective_lang = lang
-        if effective_lang is None and _LANGDETECT_AVAILABLE:
-            try:
-                detected = _langdetect(value)
-                if detected in _ASIAN_LANG_CODES:
-                    effective_lang = detected
-            except LangDetectException:
-                pass
-
+        effective_lang = _effective_lang(value, lang)
         if effective_lang is None:
-            logger.debug(f"  SKIP  field='{field}' value='{value}' — cannot determine language")
+            logger.debug("  SKIP  field='{}' value='{}' — cannot determine language", field, value)
             continue
 
         canonical = translate_esports_term(value, effective_lang)
@@ -650,7 +767,12 @@ def translate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info(f"Translating {len(df)} player records …")
     records = df.to_dict(orient="records")
+    cache_size = len(_translation_cache)
+    if _TRANSLATOR_AVAILABLE:
+        _prefetch_translations(records)
     translated = [translate_player_record(r) for r in records]
+    if len(_translation_cache) > cache_size:
+        _save_disk_cache()
     result = pd.DataFrame(translated)
     changed = sum(
         1 for orig, trans in zip(records, translated)
@@ -825,9 +947,12 @@ def score_dataframe(df: pd.DataFrame) -> pd.DataFrame:
 
     # ── Flatten nested stats dict if present ─────────────────────────────────
     if "stats" in work.columns:
-        stats_df = work["stats"].apply(
-            lambda s: s if isinstance(s, dict) else {}
-        ).apply(pd.Series)
+        # One DataFrame construction over the whole column — .apply(pd.Series)
+        # builds a throwaway Series per row and is the slow path here
+        stats_df = pd.DataFrame(
+            [s if isinstance(s, dict) else {} for s in work["stats"]],
+            index=work.index,
+        )
         for col in ("kda", "win_rate", "games_analyzed"):
             if col not in work.columns and col in stats_df.columns:
                 work[col] = stats_df[col]
@@ -851,8 +976,10 @@ def score_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     ).round(4)
 
     # ── Regional multiplier (vectorised via map) ──────────────────────────────
-    work["difficulty_mult"] = work["country"].map(
-        lambda c: REGIONAL_MULTIPLIERS.get(c, _DEFAULT_MULTIPLIER)
+    # Mapping by dict keeps the lookup in pandas' C path; fillna covers the
+    # unknown-country fallback without a per-row Python lambda
+    work["difficulty_mult"] = (
+        work["country"].map(REGIONAL_MULTIPLIERS).fillna(_DEFAULT_MULTIPLIER)
     )
 
     # ── Final score, capped at 10 ─────────────────────────────────────────────
@@ -31,6 +31,8 @@ import platform
 import subprocess
 import sys
 from datetime import datetime, timezone
+from operator import itemgetter
+from statistics import fmean
 from typing import Any
 
 from loguru import logger
@@ -43,6 +45,13 @@ except ImportError:
     INTEL_OK = False
     logger.warning("intelligence.py not found — using simple fallback scoring")
 
+# ── Optional: NumPy (vectorised fallback scoring) ─────────────────────────────
+try:
+    import numpy as np
+    NUMPY_OK = True
+except ImportError:
+    NUMPY_OK = False
+
 # ── Optional: Jinja2 ──────────────────────────────────────────────────────────
 try:
     from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -166,6 +175,39 @@ def _fallback_score(p: dict) -> float:
     return min(round(raw * mult, 4), 10.0)
 
 
+def _fallback_score_batch(players: list[dict]) -> None:
+    """
+    Vectorised _fallback_score over the whole player list.
+
+    One NumPy pipeline (clip → weight → multiply) replaces the per-player
+    dict-math loop; with NumPy missing it degrades to the scalar scorer.
+    """
+    if not NUMPY_OK:
+        for p in players:
+            p["gameradar_score"] = _fallback_score(p)
+        return
+
+    n      = len(players)
+    kda    = np.fromiter((p["kda"]            for p in players), dtype=np.float64, count=n)
+    wr     = np.fromiter((p["win_rate"]       for p in players), dtype=np.float64, count=n)
+    games  = np.fromiter((p["games_analyzed"] for p in players), dtype=np.float64, count=n)
+    mult   = np.fromiter(
+        (_MULT.get(p["country"].upper(), 1.0) for p in players),
+        dtype=np.float64, count=n,
+    )
+
+    kda_n  = np.minimum(kda,   _KDA_CAP)   / _KDA_CAP   * 10.0
+    wr_n   = np.minimum(wr,    100.0)      / 100.0      * 10.0
+    mf_n   = np.minimum(games, _GAMES_CAP) / _GAMES_CAP * 10.0
+    scores = np.minimum(
+        np.round((kda_n * _W_KDA + wr_n * _W_WR + mf_n * _W_MF) * mult, 4),
+        10.0,
+    )
+
+    for p, score in zip(players, scores.tolist()):
+        p["gameradar_score"] = score
+
+
 def _score_and_rank(players: list[dict]) -> list[dict]:
     """
     Score every player and return list sorted by final_score descending.
@@ -173,19 +215,22 @@ def _score_and_rank(players: list[dict]) -> list[dict]:
     _fallback_score() otherwise.
     """
     if INTEL_OK:
-        import pandas as pd
         ranked_df = intel.rank_players(players)
-        # Merge scored columns back onto normalised records
-        scored_map: dict[str, float] = {}
-        for _, row in ranked_df.iterrows():
-            scored_map[str(row["nickname"])] = float(row.get("final_score", 0))
+        # Merge scored columns back onto normalised records.
+        # dict(zip(...)) over whole columns avoids the per-row iterrows walk.
+        if "final_score" in ranked_df.columns:
+            scored_map = dict(zip(
+                ranked_df["nickname"].astype(str),
+                ranked_df["final_score"].astype(float),
+            ))
+        else:
+            scored_map = {}
         for p in players:
             p["gameradar_score"] = scored_map.get(p["nickname"], p["gameradar_score"])
     else:
-        for p in players:
-            p["gameradar_score"] = _fallback_score(p)
+        _fallback_score_batch(players)
 
-    players.sort(key=lambda x: x["gameradar_score"], reverse=True)
+    players.sort(key=itemgetter("gameradar_score"), reverse=True)
 
     # score_pct drives the CSS progress bar (0–100)
     for p in players:
@@ -306,12 +351,10 @@ def _compute_radar(players: list[dict]) -> dict:
         x, y = _polar_to_cartesian(_RADAR_MAX_R * max(0.0, min(1.0, v)), _axis_angle(i))
         top1_dots.append({"x": f"{x:.2f}", "y": f"{y:.2f}"})
 
-    # Region average
-    n_players = len(players)
-    avg_vals  = [
-        sum(_normalise_for_radar(p)[i] for p in players) / n_players
-        for i in range(_RADAR_N_AXES)
-    ]
+    # Region average — normalise each player once, then average per axis
+    # (the old form re-ran _normalise_for_radar once per axis per player)
+    all_vals = [_normalise_for_radar(p) for p in players]
+    avg_vals = [fmean(vals[i] for vals in all_vals) for i in range(_RADAR_N_AXES)]
     avg_pts  = _polygon_points(avg_vals)
     avg_dots = []
     for i, v in enumerate(avg_vals):
@@ -391,13 +434,12 @@ def _build_context(
     top_players = players[:top_n]
     rising_stars = players[:3]
 
-    # Region averages
-    n = len(top_players)
+    # Region averages — fmean + itemgetter keep the reduction in C
     region_avg = {
-        "kda":            round(sum(p["kda"]            for p in top_players) / n, 2),
-        "win_rate":       round(sum(p["win_rate"]       for p in top_players) / n, 1),
-        "games_analyzed": round(sum(p["games_analyzed"] for p in top_players) / n, 0),
-        "gameradar_score":round(sum(p["gameradar_score"]for p in top_players) / n, 2),
+        "kda":            round(fmean(map(itemgetter("kda"),            top_players)), 2),
+        "win_rate":       round(fmean(map(itemgetter("win_rate"),       top_players)), 1),
+        "games_analyzed": round(fmean(map(itemgetter("games_analyzed"), top_players)), 0),
+        "gameradar_score":round(fmean(map(itemgetter("gameradar_score"),top_players)), 2),
     }
 
     return {
@@ -421,6 +463,25 @@ def _build_context(
 # SECTION 6 — RENDER & GENERATE PDF
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Compiled template cached across calls — building the Environment and
+# parsing the template is repeated per region otherwise; rendering a
+# compiled Jinja2 template is thread-safe, so parallel regions share it
+_template = None
+
+
+def _get_template():
+    """Return the compiled report template, building it on first use."""
+    global _template
+    if _template is not None:
+        return _template
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(["html"]),
+    )
+    _template = env.get_template(TEMPLATE_FILE)
+    return _template
+
+
 def _open_pdf(path: pathlib.Path) -> None:
     try:
         if platform.system() == "Windows":
@@ -433,6 +494,19 @@ def _open_pdf(path: pathlib.Path) -> None:
         logger.warning(f"Could not open PDF automatically: {exc}")
 
 
+def load_scored_players(data_source: str = "master") -> list[dict]:
+    """
+    Load, normalise and score players in one pass.
+
+    The result depends only on the data source — not on the report region —
+    so callers generating several regional reports can compute it once and
+    pass it to each generate() call instead of re-running the whole
+    load → normalise → score pipeline per region.
+    """
+    raw_players = _load_players(data_source)
+    return _score_and_rank([_normalise_player(p) for p in raw_players])
+
+
 def generate(
     output_path: pathlib.Path,
     *,
@@ -443,6 +517,7 @@ def generate(
     auto_open:    bool = True,
     html_only:    bool = False,
     market_trends: list[dict] | None = None,
+    players:      list[dict] | None = None,
 ) -> None:
     """
     Full pipeline:
@@ -458,6 +533,8 @@ def generate(
     auto_open     : Open the PDF after generation.
     html_only     : Render HTML only (skip WeasyPrint).
     market_trends : Override the default market trend cards.
+    players       : Pre-scored players from load_scored_players(); when given,
+                    data_source is ignored and the load/score step is skipped.
     """
     if not JINJA2_OK:
         sys.exit(1)
@@ -475,12 +552,9 @@ def generate(
     logger.info(f"  Output   : {output_path}")
     logger.info("=" * 62)
 
-    # ── 1. Load & normalise ────────────────────────────────────────────────
-    raw_players = _load_players(data_source)
-    players     = [_normalise_player(p) for p in raw_players]
-
-    # ── 2. Score & rank ────────────────────────────────────────────────────
-    players = _score_and_rank(players)
+    # ── 1+2. Load, normalise, score & rank (skipped when pre-scored) ───────
+    if players is None:
+        players = load_scored_players(data_source)
     logger.info(f"Scored {len(players)} players. Top: {players[0]['nickname']} "
                 f"({players[0]['gameradar_score']:.4f})")
 
@@ -488,12 +562,7 @@ def generate(
     context = _build_context(players, region, report_month, top_n, trends)
 
     # ── 4. Render HTML ─────────────────────────────────────────────────────
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATE_DIR)),
-        autoescape=select_autoescape(["html"]),
-    )
-    template      = env.get_template(TEMPLATE_FILE)
-    rendered_html = template.render(**context)
+    rendered_html = _get_template().render(**context)
 
     # Dump HTML preview
     html_out = output_path.with_suffix(".html")
@@ -28,12 +28,21 @@ import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from loguru import logger
 from playwright.async_api import async_playwright, Browser, Page
 
+# orjson serializa/deserializa JSON 3-5x más rápido que stdlib (sobre todo
+# con payloads CJK pesados); si no está instalado se usa json sin más.
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
 # ──────────────────────────────────────────────────────────────
 # Imports del proyecto
 # ──────────────────────────────────────────────────────────────
@@ -140,24 +149,31 @@ LIQUIPEDIA_TARGETS = [
 # ──────────────────────────────────────────────
 # Logging
 # ──────────────────────────────────────────────
+# enqueue=True: los writes van a un proceso consumidor y no bloquean el
+# hot path de scraping (formatear+escribir por fila es coste medible).
 logger.remove()
-logger.add(sys.stdout, level="INFO",
+logger.add(sys.stdout, level="INFO", enqueue=True,
            format="<green>{time:HH:mm:ss}</green> | <level>{level:<8}</level> | {message}")
 logger.add(BRONZE_DIR / "logs" / f"ingest_{TODAY}.log",
-           rotation="50 MB", retention="14 days", level="DEBUG")
+           rotation="50 MB", retention="14 days", level="DEBUG", enqueue=True)
 
 
 # ──────────────────────────────────────────────
 # Sanitización
 # ──────────────────────────────────────────────
 
+# Precompilado a nivel de módulo: sanitize_string se llama por cada campo de
+# cada registro, y recompilar el patrón por llamada domina el coste.
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+
 def sanitize_string(value: Any) -> Optional[str]:
     """Elimina caracteres de control, trunca a 512 chars, devuelve None si vacío."""
     if value is None:
         return None
     text = str(value)
     # Eliminar caracteres de control (excepto newline/tab)
-    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", text)
+    text = _CONTROL_CHARS_RE.sub("", text)
     text = text.strip()
     return text[:512] if text else None
 
@@ -230,6 +246,20 @@ def sanitize_record(raw: Dict[str, Any], source: str) -> Dict[str, Any]:
 # Persistencia
 # ──────────────────────────────────────────────
 
+def _json_dumps(obj: Any) -> str:
+    """Serializa a JSON indentado, con orjson si está disponible."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _json_loads(text: str) -> Any:
+    """Deserializa JSON, con orjson si está disponible."""
+    if _HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 def save_bronze(records: List[Dict[str, Any]], source: str) -> Path:
     """
     Guarda registros en /bronze/<source>/<YYYY-MM-DD>.json.
@@ -242,8 +272,8 @@ def save_bronze(records: List[Dict[str, Any]], source: str) -> Path:
     existing: List[Dict[str, Any]] = []
     if dest_file.exists():
         try:
-            existing = json.loads(dest_file.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            existing = _json_loads(dest_file.read_text(encoding="utf-8"))
+        except ValueError:
             logger.warning(f"⚠️  {dest_file} corrupto — sobreescribiendo.")
 
     # Merge: nickname actúa como clave; el nuevo registro gana
@@ -256,10 +286,7 @@ def save_bronze(records: List[Dict[str, Any]], source: str) -> Path:
 
     merged = list(index.values()) + [r for r in existing if not r.get("nickname")]
 
-    dest_file.write_text(
-        json.dumps(merged, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    dest_file.write_text(_json_dumps(merged), encoding="utf-8")
     logger.success(f"💾 Guardado: {dest_file}  ({len(merged)} registros)")
     return dest_file
 
@@ -299,17 +326,13 @@ async def scrape_wanplus(
 
             player_node = data.get("data", {}).get("player") or {}
 
+            # Las métricas viven solo bajo "stats": sanitize_record no lee
+            # claves de stats a nivel raíz y duplicarlas infla el payload.
             raw = {
                 "nickname":    player_node.get("summonerName") or player_id,
                 "real_name":   player_node.get("realName"),
                 "team":        player_node.get("teamName"),
                 "role":        player_node.get("position"),
-                "win_rate":    player_node.get("winRate"),
-                "kda":         player_node.get("kda"),
-                "apm":         player_node.get("apm"),
-                "gold_per_min": player_node.get("goldPerMin"),
-                "damage_percent": player_node.get("damagePercent"),
-                "games_played": player_node.get("gamesPlayed"),
                 "rank":        player_node.get("rank"),
                 "server":      player_node.get("server", "Ionia"),
                 "country":     "CN",
@@ -325,7 +348,7 @@ async def scrape_wanplus(
                 }
             }
 
-            logger.info(f"  🇨🇳 Wanplus — {player_id}: {'datos' if player_node else 'sin datos (esqueleto)'}")
+            logger.debug(f"  🇨🇳 Wanplus — {player_id}: {'datos' if player_node else 'sin datos (esqueleto)'}")
 
         except httpx.HTTPStatusError as e:
             logger.warning(f"  ⚠️  Wanplus HTTP {e.response.status_code} para {player_id}")
@@ -354,30 +377,43 @@ async def scrape_dakgg(
     """
     results: List[Dict[str, Any]] = []
 
+    # Un solo BrowserContext para todos los targets: cada new_context()
+    # rehace cookies, caché y handshake TLS/HTTP2; compartirlo amortiza
+    # la conexión entre páginas del mismo host.
+    headers = AdvancedHeaderRotator.get_headers(RegionProfile.KOREA)
+    context = await browser.new_context(
+        user_agent=headers["User-Agent"],
+        locale="ko-KR",
+        timezone_id="Asia/Seoul",
+        viewport={"width": 1366, "height": 768},
+        extra_http_headers={
+            "Accept-Language": headers["Accept-Language"],
+            "Referer": "https://dak.gg/",
+        },
+    )
+
     for target in targets:
         player_id = target["id"]
         game      = target.get("game", "lol")
 
         await ExponentialBackoffHandler.delay(RegionProfile.KOREA)
-        headers = AdvancedHeaderRotator.get_headers(RegionProfile.KOREA)
 
         url = f"https://dak.gg/lol/players/{player_id}"
 
-        context = await browser.new_context(
-            user_agent=headers["User-Agent"],
-            locale="ko-KR",
-            timezone_id="Asia/Seoul",
-            viewport={"width": 1366, "height": 768},
-            extra_http_headers={
-                "Accept-Language": headers["Accept-Language"],
-                "Referer": "https://dak.gg/",
-            },
-        )
         page: Page = await context.new_page()
 
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=25_000)
 
+            # Espera determinista: el payload SSR está en cuanto el <script>
+            # existe en el DOM — sin sleeps arbitrarios ni networkidle.
+            try:
+                await page.wait_for_selector(
+                    "script#__NEXT_DATA__", state="attached", timeout=8_000
+                )
+            except Exception:
+                pass  # sin __NEXT_DATA__ → se usa el fallback DOM de abajo
+
             # Intentar extraer __NEXT_DATA__ (Next.js SSR payload)
             next_data_raw: str = await page.evaluate(
                 "() => document.getElementById('__NEXT_DATA__')?.textContent || ''"
@@ -387,7 +423,9 @@ async def scrape_dakgg(
 
             if next_data_raw:
                 try:
-                    next_data = json.loads(next_data_raw)
+                    # El payload SSR vuelve como string y se decodifica
+                    # con orjson si está disponible (CJK-pesado)
+                    next_data = _json_loads(next_data_raw)
                     # La estructura varía, buscamos el nodo de jugador
                     props   = next_data.get("props", {}).get("pageProps", {})
                     profile = (
@@ -396,14 +434,12 @@ async def scrape_dakgg(
                         or props.get("data", {}).get("player")
                         or {}
                     )
+                    # Igual que en Wanplus: métricas solo bajo "stats"
                     raw = {
                         "nickname":   profile.get("summonerName") or profile.get("name") or player_id,
                         "real_name":  profile.get("realName"),
                         "team":       profile.get("teamName") or profile.get("team"),
                         "rank":       (profile.get("tier") or "") + " " + (profile.get("division") or ""),
-                        "win_rate":   profile.get("winRate") or profile.get("wins"),
-                        "kda":        profile.get("kda"),
-                        "games_played": profile.get("totalGames") or profile.get("games"),
                         "server":     "KR",
                         "country":    "KR",
                         "game":       "LOL",
@@ -414,8 +450,8 @@ async def scrape_dakgg(
                             "games_analyzed": profile.get("totalGames"),
                         },
                     }
-                    logger.info(f"  🇰🇷 Dak.gg — {player_id}: extraído desde __NEXT_DATA__")
-                except json.JSONDecodeError:
+                    logger.debug(f"  🇰🇷 Dak.gg — {player_id}: extraído desde __NEXT_DATA__")
+                except ValueError:
                     logger.warning(f"  ⚠️  Dak.gg — {player_id}: __NEXT_DATA__ malformado")
                     raw = _skeleton(player_id, "KR", "KR", "dakgg")
             else:
@@ -432,10 +468,10 @@ async def scrape_dakgg(
 
         finally:
             await page.close()
-            await context.close()
 
         results.append(sanitize_record(raw, "dakgg"))
 
+    await context.close()
     return results
 
 
@@ -488,7 +524,7 @@ async def scrape_tec_india(
                     "community_rating":          player_node.get("rating"),
                 },
             }
-            logger.info(f"  🇮🇳 TEC India — {player_id}: datos recibidos")
+            logger.debug(f"  🇮🇳 TEC India — {player_id}: datos recibidos")
 
         except httpx.HTTPStatusError as e:
             logger.warning(f"  ⚠️  TEC India HTTP {e.response.status_code} para {player_id}")
@@ -523,7 +559,8 @@ async def scrape_via_adapter(
             raw = await adapter.fetch_player(player_id, game=game)
             if raw:
                 results.append(sanitize_record(raw, source_name))
-                logger.info(f"  ✅ {source_name} — {player_id}")
+                # Por-fila solo a nivel DEBUG (va al archivo, no a stdout)
+                logger.debug(f"  ✅ {source_name} — {player_id}")
             else:
                 logger.warning(f"  ⚠️  {source_name} — {player_id}: sin datos")
                 results.append(sanitize_record(
@@ -566,8 +603,15 @@ def _build_summary(source_results: Dict[str, List[Dict]]) -> Dict[str, Any]:
     def count_full(records: List[Dict]) -> int:
         return sum(1 for r in records if not r.get("_partial"))
 
+    # "nicknames" conserva las claves exactas de esta corrida (nickname es
+    # la PK de merge en save_bronze): el paso Silver puede verificar solo
+    # esos registros en vez de re-escanear toda la capa Bronze del día.
     breakdown = {
-        src: {"total": len(recs), "with_data": count_full(recs)}
+        src: {
+            "total": len(recs),
+            "with_data": count_full(recs),
+            "nicknames": [r["nickname"] for r in recs if r.get("nickname")],
+        }
         for src, recs in source_results.items()
     }
     return {
@@ -604,6 +648,24 @@ async def main(sources: Optional[List[str]] = None, dry_run: bool = False) -> No
 
     source_results: Dict[str, List[Dict]] = {}
 
+    async def _scrape_dakgg_with_browser() -> List[Dict[str, Any]]:
+        """Wrapper que gestiona el ciclo de vida de Playwright para Dak.gg."""
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--no-sandbox",
+                    "--disable-setuid-sandbox",
+                    "--disable-blink-features=AutomationControlled",
+                    "--disable-dev-shm-usage",
+                    "--disable-gpu",
+                ],
+            )
+            try:
+                return await scrape_dakgg(DAKGG_TARGETS, browser)
+            finally:
+                await browser.close()
+
     async with httpx.AsyncClient(
         timeout=30,
         limits=httpx.Limits(max_connections=5, max_keepalive_connections=3),
@@ -611,86 +673,84 @@ async def main(sources: Optional[List[str]] = None, dry_run: bool = False) -> No
         http2=True,
     ) as http_client:
 
+        # Cada fuente es independiente y está limitada por IO (y por el
+        # rate-limit regional de su propio adapter), así que se lanzan todas
+        # en paralelo con asyncio.gather en vez de esperarlas una a una.
+        pending: Dict[str, Any] = {}
+
         if "wanplus" in sources:
-            logger.info("\n📡  Scraping Wanplus (China / LPL)…")
-            source_results["wanplus"] = await scrape_wanplus(WANPLUS_TARGETS, http_client)
+            pending["wanplus"] = scrape_wanplus(WANPLUS_TARGETS, http_client)
 
         if "tec_india" in sources:
-            logger.info("\n📡  Scraping The Esports Club (India)…")
-            source_results["tec_india"] = await scrape_tec_india(TEC_INDIA_TARGETS, http_client)
+            pending["tec_india"] = scrape_tec_india(TEC_INDIA_TARGETS, http_client)
 
         if "opgg_kr" in sources:
-            logger.info("\n📡  Scraping OP.GG Korea…")
             adapter = OPGGAdapter(client=http_client, region="kr")
-            source_results["opgg_kr"] = await scrape_via_adapter(OPGG_KR_TARGETS, adapter, "opgg_kr")
+            pending["opgg_kr"] = scrape_via_adapter(OPGG_KR_TARGETS, adapter, "opgg_kr")
 
         if "opgg_jp" in sources:
-            logger.info("\n📡  Scraping OP.GG Japan…")
             adapter = OPGGAdapter(client=http_client, region="jp")
-            source_results["opgg_jp"] = await scrape_via_adapter(OPGG_JP_TARGETS, adapter, "opgg_jp")
+            pending["opgg_jp"] = scrape_via_adapter(OPGG_JP_TARGETS, adapter, "opgg_jp")
 
         if "zeta_division" in sources:
-            logger.info("\n📡  Scraping ZETA Division (Japan)…")
             adapter = ZetaDivisionAdapter(client=http_client)
-            source_results["zeta_division"] = await scrape_via_adapter(ZETA_TARGETS, adapter, "zeta_division")
+            pending["zeta_division"] = scrape_via_adapter(ZETA_TARGETS, adapter, "zeta_division")
 
         if "detonation" in sources:
-            logger.info("\n📡  Scraping DetonatioN FocusMe (Japan)…")
             adapter = DetonatioNAdapter(client=http_client)
-            source_results["detonation"] = await scrape_via_adapter(DETONATION_TARGETS, adapter, "detonation")
+            pending["detonation"] = scrape_via_adapter(DETONATION_TARGETS, adapter, "detonation")
 
         if "gamei_japan" in sources:
-            logger.info("\n📡  Scraping Game-i.daa.jp (Japan rankings)…")
             adapter = GameiJapanAdapter(client=http_client)
-            source_results["gamei_japan"] = await scrape_via_adapter(GAMEI_JAPAN_TARGETS, adapter, "gamei_japan")
+            pending["gamei_japan"] = scrape_via_adapter(GAMEI_JAPAN_TARGETS, adapter, "gamei_japan")
 
         if "pentaq" in sources:
-            logger.info("\n📡  Scraping PentaQ (China analysis)…")
             adapter = PentaQAdapter(client=http_client)
-            source_results["pentaq"] = await scrape_via_adapter(PENTAQ_TARGETS, adapter, "pentaq")
+            pending["pentaq"] = scrape_via_adapter(PENTAQ_TARGETS, adapter, "pentaq")
 
         if "vrl_vyper" in sources:
-            logger.info("\n📡  Scraping VRL Vyper (India / Valorant)…")
             adapter = VRLVyperAdapter(client=http_client)
-            source_results["vrl_vyper"] = await scrape_via_adapter(VRL_VYPER_TARGETS, adapter, "vrl_vyper")
+            pending["vrl_vyper"] = scrape_via_adapter(VRL_VYPER_TARGETS, adapter, "vrl_vyper")
 
         if "gosugamers_sea" in sources:
-            logger.info("\n📡  Scraping GosuGamers SEA (Dota2/ML)…")
             adapter = GosuGamersSEAAdapter(client=http_client)
-            source_results["gosugamers_sea"] = await scrape_via_adapter(GOSUGAMERS_TARGETS, adapter, "gosugamers_sea")
+            pending["gosugamers_sea"] = scrape_via_adapter(GOSUGAMERS_TARGETS, adapter, "gosugamers_sea")
 
         if "liquipedia" in sources:
-            logger.info("\n📡  Scraping Liquipedia (global backup)…")
             adapter = LiquipediaAdapter(client=http_client)
-            source_results["liquipedia"] = await scrape_via_adapter(LIQUIPEDIA_TARGETS, adapter, "liquipedia")
+            pending["liquipedia"] = scrape_via_adapter(LIQUIPEDIA_TARGETS, adapter, "liquipedia")
 
         if "dakgg" in sources:
-            logger.info("\n📡  Scraping Dak.gg (Korea / Playwright)…")
-            async with async_playwright() as pw:
-                browser = await pw.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-blink-features=AutomationControlled",
-                        "--disable-dev-shm-usage",
-                        "--disable-gpu",
-                    ],
-                )
-                source_results["dakgg"] = await scrape_dakgg(DAKGG_TARGETS, browser)
-                await browser.close()
-
-    if not dry_run:
-        for src, records in source_results.items():
-            if records:
+            pending["dakgg"] = _scrape_dakgg_with_browser()
+
+        logger.info(f"\n📡  Scraping {len(pending)} fuentes en paralelo…")
+
+        # Productor/consumidor: cada fuente se persiste en cuanto termina,
+        # en vez de esperar a que TODAS acaben para recién escribir. Así el
+        # write a disco se solapa con los scrapes aún en vuelo, y un crash
+        # a mitad de corrida no pierde las fuentes ya completadas.
+        async def _run_source(src: str, coro) -> Tuple[str, List[Dict[str, Any]]]:
+            try:
+                return src, await coro
+            except Exception as e:
+                logger.error(f"  ✗ {src}: {type(e).__name__}: {e}")
+                return src, []
+
+        for fut in asyncio.as_completed(
+            [_run_source(src, coro) for src, coro in pending.items()]
+        ):
+            src, records = await fut
+            source_results[src] = records
+            if records and not dry_run:
                 save_bronze(records, src)
-    else:
+
+    if dry_run:
         logger.info("\n[DRY-RUN] No se escribieron archivos.")
 
     summary = _build_summary(source_results)
     summary_path = BRONZE_DIR / "logs" / f"summary_{TODAY}.json"
     summary_path.parent.mkdir(parents=True, exist_ok=True)
-    summary_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    summary_path.write_text(_json_dumps(summary), encoding="utf-8")
 
     logger.info("\n" + "=" * 70)
     logger.info("📊  RESUMEN FINAL")
@@ -39,7 +39,8 @@ from scraping.strategic_adapters import (
 from ingestion.universal_aggregator import (
     UniversalAggregator,
     CircuitBreaker,
-    SimpleCache
+    SimpleCache,
+    DEFAULT_CACHE_PERSIST_PATH
 )
 
 # Supabase removed — logging to file only
@@ -72,6 +73,8 @@ class IngestionConfig:
     # Cache
     cache_ttl: int = 300  # 5 minutos
     enable_cache: bool = True
+    # Archivo para persistir el caché entre ejecuciones (None = solo memoria)
+    cache_persist_path: Optional[str] = DEFAULT_CACHE_PERSIST_PATH
     
     # Circuit Breaker
     circuit_breaker_threshold: int = 5
@@ -243,7 +246,14 @@ class MultiRegionIngestor:
         )
         
         # Cache compartido
-        self.cache = SimpleCache(ttl_seconds=self.config.cache_ttl) if self.config.enable_cache else None
+        self.cache = (
+            SimpleCache(
+                ttl_seconds=self.config.cache_ttl,
+                persist_path=self.config.cache_persist_path,
+            )
+            if self.config.enable_cache
+            else None
+        )
         
         # Supabase removido; se conserva el atributo para compatibilidad interna.
         self.supabase_client = None
@@ -285,7 +295,8 @@ class MultiRegionIngestor:
         # Inicializar Universal Aggregator
         self.aggregator = UniversalAggregator(
             cache_ttl=self.config.cache_ttl,
-            circuit_breaker_threshold=self.config.circuit_breaker_threshold
+            circuit_breaker_threshold=self.config.circuit_breaker_threshold,
+            cache_persist_path=self.config.cache_persist_path
         )
         await self.aggregator.__aenter__()
         
@@ -592,18 +603,20 @@ class MultiRegionIngestor:
             Reportes por región
         """
         logger.info("🌍 Starting region-priority ingestion")
-        
-        reports = {}
-        
-        for region, players in players_by_region.items():
+
+        # Cada región es independiente (adapters y rate-limits propios), así
+        # que los batches corren en paralelo con gather en vez de esperar a
+        # que una región termine para arrancar la siguiente
+        async def _ingest_region(region: RegionProfile, players: List[str]):
             logger.info(f"📍 Processing region: {region} ({len(players)} players)")
-            
-            # Convertir a formato (identifier, region)
             player_tuples = [(p, region) for p in players]
-            
-            # Ingerir batch
-            report = await self.ingest_players_batch(player_tuples, game)
-            reports[region] = report
+            return region, await self.ingest_players_batch(player_tuples, game)
+
+        region_reports = await asyncio.gather(*[
+            _ingest_region(region, players)
+            for region, players in players_by_region.items()
+        ])
+        reports = dict(region_reports)
         
         # Resumen global
         total_players = sum(r.total_players for r in reports.values())
@@ -40,6 +40,15 @@ from tenacity import (
 from core.models import PlayerProfile, PlayerStats, Champion, GameTitle, CountryCode
 from core.config import settings
 
+# orjson opcional para la persistencia del caché (mismo patrón que
+# ingest_bronze_targets): el volcado corre en cada set(), así que la
+# serialización es el costo dominante del caché en disco
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 # ============================================================================
 # CONFIGURACIÓN Y ENUMS
@@ -143,22 +152,99 @@ class HeaderRotator:
 # SISTEMA DE CACHÉ
 # ============================================================================
 
+# Ruta por defecto para persistir el caché entre ejecuciones (cada run del
+# job programado es un proceso nuevo); pasar None deshabilita la persistencia
+DEFAULT_CACHE_PERSIST_PATH = "bronze/.aggregator_cache.json"
+
+
 class SimpleCache:
     """
     Sistema de caché en memoria con TTL
     Reduce requests duplicados a las mismas fuentes
+
+    Opcionalmente persiste a disco (persist_path) para que ejecuciones
+    cortas consecutivas — p.ej. el job de GitHub Actions cada 12 h con un
+    TTL largo — no vuelvan a scrapear los mismos perfiles.
     """
-    
-    def __init__(self, ttl_seconds: int = 300):
+
+    def __init__(self, ttl_seconds: int = 300, persist_path: Optional[str] = None):
         """
         Inicializa el caché
-        
+
         Args:
             ttl_seconds: Tiempo de vida de las entradas en segundos
+            persist_path: Archivo JSON opcional para persistir entre ejecuciones
         """
         self.cache: Dict[str, Dict[str, Any]] = {}
         self.ttl_seconds = ttl_seconds
-    
+        self.persist_path = persist_path
+        if persist_path:
+            self._load_from_disk()
+
+    def _load_from_disk(self):
+        """Carga entradas no expiradas desde el archivo de persistencia."""
+        import json
+        import pathlib
+
+        path = pathlib.Path(self.persist_path)
+        if not path.exists():
+            return
+        try:
+            if _HAS_ORJSON:
+                raw = orjson.loads(path.read_bytes())
+            else:
+                raw = json.loads(path.read_text(encoding="utf-8"))
+            now = datetime.now(timezone.utc)
+            for key, entry in raw.items():
+                expires_at = datetime.fromisoformat(entry["expires_at"])
+                if now < expires_at:
+                    self.cache[key] = {"data": entry["data"], "expires_at": expires_at}
+            logger.debug(f"💾 Cache cargado de disco: {len(self.cache)} entradas vigentes")
+        except (json.JSONDecodeError, KeyError, ValueError, OSError) as e:
+            logger.warning(f"⚠️ Cache de disco ilegible ({e}) — empezando vacío")
+
+    def _save_to_disk(self, merge: bool = True):
+        """Vuelca el caché actual al archivo de persistencia.
+
+        Con merge=True conserva las entradas vigentes ya persistidas por
+        otra instancia que comparta el mismo archivo (p.ej. el caché del
+        ingestor y el del aggregator que corre dentro de él).
+        """
+        import json
+        import pathlib
+
+        if not self.persist_path:
+            return
+        try:
+            path = pathlib.Path(self.persist_path)
+            serializable: Dict[str, Any] = {}
+            if merge and path.exists():
+                try:
+                    if _HAS_ORJSON:
+                        raw = orjson.loads(path.read_bytes())
+                    else:
+                        raw = json.loads(path.read_text(encoding="utf-8"))
+                    now = datetime.now(timezone.utc)
+                    serializable = {
+                        key: entry
+                        for key, entry in raw.items()
+                        if key not in self.cache
+                        and now < datetime.fromisoformat(entry["expires_at"])
+                    }
+                except (json.JSONDecodeError, KeyError, ValueError, OSError):
+                    pass  # archivo ilegible: se sobreescribe con lo vigente
+            serializable.update({
+                key: {"data": entry["data"], "expires_at": entry["expires_at"].isoformat()}
+                for key, entry in self.cache.items()
+            })
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if _HAS_ORJSON:
+                path.write_bytes(orjson.dumps(serializable))
+            else:
+                path.write_text(json.dumps(serializable, ensure_ascii=False), encoding="utf-8")
+        except (TypeError, OSError) as e:
+            logger.warning(f"⚠️ No se pudo persistir el caché: {e}")
+
     def _generate_key(self, source: str, identifier: str) -> str:
         """Genera clave única para caché"""
         key_data = f"{source}:{identifier}"
@@ -191,10 +277,12 @@ class SimpleCache:
             "expires_at": expires_at
         }
         logger.debug(f"💾 Cache SET: {source}:{identifier}")
-    
+        self._save_to_disk()
+
     def clear(self):
-        """Limpia todo el caché"""
+        """Limpia todo el caché (también el archivo persistido)"""
         self.cache.clear()
+        self._save_to_disk(merge=False)
         logger.info("🗑️ Caché limpiado")
 
 
@@ -660,13 +748,20 @@ class UniversalAggregator:
     Coordina múltiples adapters y maneja fallos gracefully
     """
     
-    def __init__(self, cache_ttl: int = 300, circuit_breaker_threshold: int = 5):
+    def __init__(
+        self,
+        cache_ttl: int = 300,
+        circuit_breaker_threshold: int = 5,
+        cache_persist_path: Optional[str] = DEFAULT_CACHE_PERSIST_PATH,
+    ):
         """
         Inicializa el agregador
-        
+
         Args:
             cache_ttl: Tiempo de vida del caché en segundos
             circuit_breaker_threshold: Número de fallos antes de abrir circuito
+            cache_persist_path: Archivo JSON para persistir el caché entre
+                ejecuciones (None = solo en memoria)
         """
         # Cliente HTTP compartido con configuración optimizada
         self.http_client = httpx.AsyncClient(
@@ -677,7 +772,7 @@ class UniversalAggregator:
         )
         
         # Sistemas auxiliares
-        self.cache = SimpleCache(ttl_seconds=cache_ttl)
+        self.cache = SimpleCache(ttl_seconds=cache_ttl, persist_path=cache_persist_path)
         self.circuit_breaker = CircuitBreaker(failure_threshold=circuit_breaker_threshold)
         
         # Adapters instanciados
@@ -827,7 +922,28 @@ class UniversalAggregator:
         """
         logger.debug("insert_to_bronze_supabase: Supabase removed — persistence handled by ingest pipeline")
         return False
-    
+
+    async def insert_many_to_bronze(self, players_data: List[Dict[str, Any]]) -> int:
+        """
+        Versión batch de insert_to_bronze. Stub no-op: Supabase fue
+        eliminado y la persistencia la hace el ingest pipeline; se conserva
+        la firma batch para compatibilidad con los callers.
+
+        Args:
+            players_data: Lista de datos de jugadores
+
+        Returns:
+            0 siempre (no se persiste nada desde aquí)
+        """
+        if not players_data:
+            return 0
+        logger.debug(
+            f"insert_many_to_bronze: Supabase removed — lote de "
+            f"{len(players_data)} registros ignorado (persistence handled "
+            "by ingest pipeline)"
+        )
+        return 0
+
     def get_global_metrics(self) -> Dict[str, Any]:
         """Obtiene métricas globales del agregador"""
         adapter_metrics = [adapter.get_metrics() for adapter in self.adapters.values()]
@@ -932,9 +1048,8 @@ async def main():
             max_concurrent=3
         )
         
-        for result in results:
-            await aggregator.insert_to_bronze(result)
-        
+        await aggregator.insert_many_to_bronze(results)
+
         # Métricas finales
         logger.info("\n📊 Métricas Globales:")
         metrics = aggregator.get_global_metrics()
@@ -3,34 +3,126 @@ CNN Brasil E-sports Scraper - Ninja Mode 🥷
 Script rápido y eficiente con proxy rotation y error handling silencioso
 """
 import asyncio
+import hashlib
+import math
+import os
 import random
+import re
+from collections import deque
+from pathlib import Path
 from typing import List, Optional, Dict, Any
+
+import httpx
+from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright, Browser, Page, ProxySettings
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from datetime import datetime, timezone
 
 from core.models import PlayerProfile, PlayerStats, Champion, GameTitle, CountryCode
 from core.country_detector import detect_country
-from core.config import settings
+from core.config import HOT
 
 
-# Lista de proxies rotativos (añadir proxies reales en producción)
-PROXY_LIST = [
+# Proxies rotativos, inmutables (añadir proxies reales en producción)
+PROXY_LIST = (
     # Free proxies - reemplazar con proxies premium en producción
     {"server": "http://proxy1.example.com:8080"},
     {"server": "http://proxy2.example.com:8080"},
     {"server": "http://proxy3.example.com:8080"},
-]
+)
 
-# User agents rotativos
-USER_AGENTS = [
+# User agents rotativos, inmutables
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
-]
+)
+_UA_LEN = len(USER_AGENTS)
+
+
+# Precompilado: se usa por cada uno de los hasta 100 elementos por scrape
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+
+
+def _simhash64(text: str) -> int:
+    """
+    SimHash de 64 bits sobre los tokens del texto (sin dependencias).
+
+    CNN Brasil republica la misma bio bajo slugs distintos, así que el
+    dedup por URL no alcanza: dos textos casi idénticos producen hashes
+    a distancia de Hamming pequeña y se pueden colapsar como near-dups.
+    Los dígitos se descartan (fechas/stats cambian entre republicaciones).
+    """
+    weights = [0] * 64
+    for token in _NUMBER_RE.sub("", text.lower()).split():
+        h = int.from_bytes(
+            hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(64):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+# Anti-detección: se registra una sola vez por BrowserContext
+_STEALTH_INIT_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    window.navigator.chrome = {
+        runtime: {},
+    };
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['pt-BR', 'pt', 'en-US', 'en'],
+    });
+"""
+
+
+class _BloomFilter:
+    """
+    Filtro de Bloom mínimo persistido en disco para dedup entre runs.
+
+    Test de pertenencia O(1) con ~1% de falsos positivos a 10 bits/clave;
+    suficiente para no re-persistir los mismos profile_url en cada run
+    programado, sin añadir dependencias externas.
+    """
+
+    def __init__(self, path: Path, capacity: int = 1_000_000, error_rate: float = 0.01):
+        self.path = path
+        self.num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+
+        expected_size = (self.num_bits + 7) // 8
+        if path.exists() and path.stat().st_size == expected_size:
+            self._bits = bytearray(path.read_bytes())
+        else:
+            self._bits = bytearray(expected_size)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big")
+        # Double hashing: k posiciones a partir de dos hashes
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(bytes(self._bits))
 
 
 class CNNBrasilNinjaScraper:
@@ -52,6 +144,82 @@ class CNNBrasilNinjaScraper:
         self.db = None  # Supabase removed; persistence handled by ingest pipeline
         self.scraped_count = 0
         self.error_count = 0
+
+        # URLs ya persistidas en runs anteriores (dedup cross-run)
+        self._seen = _BloomFilter(Path(__file__).parent.parent / "bronze" / "cnn_seen.bloom")
+
+        # SimHashes recientes para colapsar near-duplicados (misma bio,
+        # slug distinto) que el dedup exacto por URL no detecta
+        self._recent_hashes: deque = deque(maxlen=2048)
+
+        # Recursos Playwright persistentes entre runs (ver __aenter__)
+        self._pw = None
+        self._browser: Optional[Browser] = None
+        self._context = None
+
+        # Cliente HTTP persistente del fast path (lazy, ver _ensure_http):
+        # keep-alive + HTTP/2 amortizan el handshake TCP/TLS entre runs
+        self._http: Optional[httpx.AsyncClient] = None
+
+        # Timestamp compartido del run; lo fija run_ninja_scrape
+        self._run_ts = datetime.now(timezone.utc).isoformat()
+
+    async def __aenter__(self):
+        """
+        Context manager: browser y contexto vivos entre runs.
+        El browser se arranca lazy (solo si el fast path HTTP no alcanza).
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager: liberar recursos Playwright y HTTP"""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        if self._context:
+            await self._context.close()
+            self._context = None
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._pw:
+            await self._pw.stop()
+            self._pw = None
+
+    async def _ensure_browser(self) -> None:
+        """
+        Arranca Playwright + browser + contexto una sola vez.
+        El cold start de Chromium (~1-2s) se paga solo en el primer run;
+        invocaciones posteriores reutilizan el mismo contexto.
+        """
+        if self._context is not None:
+            return
+
+        self._pw = await async_playwright().start()
+        self._browser = await self._pw.chromium.launch(
+            headless=True,
+            proxy=self._get_random_proxy()
+        )
+        self._context = await self._browser.new_context(
+            user_agent=self._get_random_user_agent(),
+            locale="pt-BR",
+            extra_http_headers={
+                "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Referer": "https://www.google.com/",
+            },
+        )
+        # Registrado una vez en el contexto, aplica a todas las páginas
+        await self._context.add_init_script(_STEALTH_INIT_JS)
+
+        # Bloquear recursos que el scraper nunca lee (solo usa inner_text):
+        # imágenes, fuentes, media y CSS son 70-90% de los bytes de la página
+        await self._context.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in {"image", "media", "font", "stylesheet"}
+            else route.continue_()
+        )
         
     def _get_random_proxy(self) -> Optional[Dict[str, str]]:
         """Obtiene un proxy aleatorio de la lista"""
@@ -60,54 +228,132 @@ class CNNBrasilNinjaScraper:
         return random.choice(PROXY_LIST)
     
     def _get_random_user_agent(self) -> str:
-        """Obtiene un user agent aleatorio"""
-        return random.choice(USER_AGENTS)
+        """Obtiene un user agent aleatorio (índice directo, sin choice)"""
+        return USER_AGENTS[random.randrange(_UA_LEN)]
     
-    async def _create_stealth_page(self, browser: Browser) -> Page:
+    async def _create_stealth_page(self) -> Page:
         """
-        Crea una página con configuración stealth
-        
-        Args:
-            browser: Instancia del browser
-            
-        Returns:
-            Página configurada en modo stealth
+        Crea una página del contexto stealth persistente.
+        Headers, UA e init script ya viven en el BrowserContext.
         """
-        page = await browser.new_page()
-        
-        # Configurar user agent aleatorio
-        await page.set_extra_http_headers({
-            "User-Agent": self._get_random_user_agent(),
-            "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Referer": "https://www.google.com/",
-        })
-        
-        # Anti-detección: ocultar webdriver
-        await page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            window.navigator.chrome = {
-                runtime: {},
-            };
-            
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-            
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['pt-BR', 'pt', 'en-US', 'en'],
-            });
-        """)
-        
-        return page
+        return await self._context.new_page()
     
+    # Selectores de cards de jugador (compartidos por ambos caminos)
+    CARD_SELECTORS = "article, .card, .player-card, .athlete-card, .esports-player, [data-player]"
+
+    def _build_player_data(self, text: str, profile_url: Optional[str], idx: int) -> Dict[str, Any]:
+        """
+        Construye el dict de jugador a partir del texto y el href de un card.
+        Compartido entre el camino HTTP estático y el fallback Playwright.
+        """
+        # Extraer nickname: primera línea no vacía, sin materializar la
+        # lista completa (las páginas de artículo traen cientos de líneas)
+        nickname = next(
+            (line.strip() for line in text.split('\n') if line.strip()),
+            f"Player_{idx+1}"
+        )
+
+        # Detectar país desde el texto
+        country = detect_country(
+            profile_text=text,
+            url=self.TARGET_URL
+        )
+
+        # Extraer stats si están disponibles
+        # Buscar números que puedan ser win rate o KDA
+        numbers = _NUMBER_RE.findall(text)
+
+        win_rate = float(numbers[0]) if len(numbers) > 0 else 50.0
+        kda = float(numbers[1]) if len(numbers) > 1 else 2.0
+
+        # Asegurar que win_rate esté en rango válido
+        if win_rate > 100:
+            win_rate = 50.0
+
+        # Asegurar URL completa
+        if profile_url and not profile_url.startswith("http"):
+            profile_url = f"https://www.cnnbrasil.com.br{profile_url}"
+
+        return {
+            # Clave interna para near-dedup; se descarta antes de persistir
+            "_simhash": _simhash64(f"{nickname} {text}"),
+            "nickname": nickname[:100],  # Limitar a 100 caracteres
+            "game": "ESPORTS",  # Genérico
+            "country": country.value,
+            "server": "BR",
+            "rank": "Unknown",
+            "win_rate": min(max(win_rate, 0), 100),  # Clamp entre 0-100
+            "kda": max(kda, 0),
+            "profile_url": profile_url or self.TARGET_URL,
+            "source": "cnn_brasil",
+        }
+
+    def _ensure_http(self) -> httpx.AsyncClient:
+        """
+        Cliente HTTP compartido del scraper, creado una sola vez.
+        Pool acotado por HOT.max_concurrent_requests; se cierra en
+        __aexit__ junto con el resto de los recursos.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=HOT.max_concurrent_requests,
+                    max_keepalive_connections=HOT.max_concurrent_requests,
+                ),
+                headers={
+                    "User-Agent": self._get_random_user_agent(),
+                    "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Referer": "https://www.google.com/",
+                },
+            )
+        return self._http
+
+    async def _scrape_static(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Camino rápido sin browser: la página de CNN Brasil es mayormente
+        server-side, así que un GET + BeautifulSoup evita los ~2s de cold
+        start de Chromium. Devuelve None si el HTML no trae los cards
+        esperados (y el caller cae al fallback Playwright).
+        """
+        try:
+            resp = await self._ensure_http().get(self.TARGET_URL)
+            resp.raise_for_status()
+
+            soup = BeautifulSoup(resp.text, "html.parser")
+            elements = soup.select(self.CARD_SELECTORS)[:100]
+            if not elements:
+                return None
+
+            players_data = []
+            for idx, element in enumerate(elements):
+                try:
+                    text = element.get_text("\n", strip=True)
+                    link = element.find("a")
+                    href = link.get("href") if link else None
+                    players_data.append(self._build_player_data(text, href, idx))
+                except Exception as e:
+                    logger.debug(f"Error extrayendo jugador {idx}: {e}")
+                    continue
+
+            return players_data or None
+
+        except Exception as e:
+            # Ninja mode: el fast path nunca rompe el run
+            logger.debug(f"Fast path HTTP falló, fallback a Playwright: {e}")
+            return None
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(Exception),
+        # Solo errores transitorios: reintentar ante un KeyError/bug de
+        # selector solo añade hasta 30s de sleeps sin posibilidad de éxito
+        retry=retry_if_exception_type(
+            (PlaywrightTimeout, ConnectionError, asyncio.TimeoutError)
+        ),
         reraise=False  # Ninja mode: no reraise, silent failure
     )
     async def _scrape_player_data(self, page: Page) -> List[Dict[str, Any]]:
@@ -124,95 +370,35 @@ class CNNBrasilNinjaScraper:
             # Navegar a la página objetivo
             await page.goto(self.TARGET_URL, wait_until="domcontentloaded", timeout=30000)
             
-            # Esperar a que cargue el contenido principal
-            await page.wait_for_selector("article, .card, .player-card", timeout=10000)
-            
-            # Extraer artículos/cards de jugadores
-            # Nota: Los selectores específicos dependen de la estructura real del sitio
-            # Estos son selectores genéricos que deben ajustarse
-            
+            # Esperar a que cargue el contenido principal. CSS soporta listas
+            # de selectores nativamente: una sola llamada cubre todos los
+            # selectores candidatos (antes: hasta 6 query_selector_all).
+            await page.wait_for_selector(self.CARD_SELECTORS, timeout=10000)
+
             players_data = []
-            
-            # Intentar diferentes selectores comunes
-            selectors = [
-                "article",
-                ".card",
-                ".player-card",
-                ".athlete-card",
-                ".esports-player",
-                "[data-player]",
-            ]
-            
-            elements = None
-            for selector in selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if elements and len(elements) > 0:
-                        break
-                except:
-                    continue
-            
-            if not elements:
-                # Si no encuentra elementos, extraer del texto completo
-                content = await page.content()
+
+            # Un solo round-trip al browser: text + href de los top 100 cards
+            # (antes: 3 llamadas IPC por elemento, ~300 para 100 jugadores)
+            extracted = await page.evaluate(
+                """(sel) => {
+                    const els = Array.from(document.querySelectorAll(sel)).slice(0, 100);
+                    return els.map(e => ({
+                        text: e.innerText || '',
+                        href: (e.querySelector('a') || {}).href || ''
+                    }));
+                }""",
+                self.CARD_SELECTORS
+            )
+
+            if not extracted:
                 logger.warning("⚠ No se encontraron elementos específicos, extrayendo del contenido general")
                 return []
-            
-            # Limitar a top 100
-            elements = elements[:100]
-            
-            for idx, element in enumerate(elements):
+
+            for idx, item in enumerate(extracted):
                 try:
-                    # Extraer texto del elemento
-                    text = await element.inner_text()
-                    
-                    # Buscar patrones comunes
-                    # Esto es genérico y debe ajustarse según la estructura real
-                    
-                    # Extraer nickname (primera línea o texto más destacado)
-                    lines = [line.strip() for line in text.split('\n') if line.strip()]
-                    nickname = lines[0] if lines else f"Player_{idx+1}"
-                    
-                    # Detectar país desde el texto
-                    country = detect_country(
-                        profile_text=text,
-                        url=self.TARGET_URL
+                    players_data.append(
+                        self._build_player_data(item["text"], item["href"] or None, idx)
                     )
-                    
-                    # Extraer stats si están disponibles
-                    # Buscar números que puedan ser win rate o KDA
-                    import re
-                    numbers = re.findall(r'\d+\.?\d*', text)
-                    
-                    win_rate = float(numbers[0]) if len(numbers) > 0 else 50.0
-                    kda = float(numbers[1]) if len(numbers) > 1 else 2.0
-                    
-                    # Asegurar que win_rate esté en rango válido
-                    if win_rate > 100:
-                        win_rate = 50.0
-                    
-                    # Extraer enlace del perfil
-                    link_element = await element.query_selector("a")
-                    profile_url = await link_element.get_attribute("href") if link_element else self.TARGET_URL
-                    
-                    # Asegurar URL completa
-                    if profile_url and not profile_url.startswith("http"):
-                        profile_url = f"https://www.cnnbrasil.com.br{profile_url}"
-                    
-                    player_data = {
-                        "nickname": nickname[:100],  # Limitar a 100 caracteres
-                        "game": "ESPORTS",  # Genérico
-                        "country": country.value,
-                        "server": "BR",
-                        "rank": "Unknown",
-                        "win_rate": min(max(win_rate, 0), 100),  # Clamp entre 0-100
-                        "kda": max(kda, 0),
-                        "profile_url": profile_url or self.TARGET_URL,
-                        "source": "cnn_brasil",
-                    }
-                    
-                    players_data.append(player_data)
-                    
                 except Exception as e:
                     # Ninja mode: silent error, continue
                     logger.debug(f"Error extrayendo jugador {idx}: {e}")
@@ -225,39 +411,57 @@ class CNNBrasilNinjaScraper:
             logger.debug(f"Error en scraping: {e}")
             return []
     
-    async def _upsert_player_to_supabase(self, player_data: Dict[str, Any]) -> bool:
+    async def _upsert_players_batch(self, players_data: List[Dict[str, Any]]) -> int:
         """
-        Hace upsert de un jugador en Supabase
-        Si es de India, añade tag 'Region: India'
-        
+        Persiste el lote completo de jugadores en una sola operación Bronze
+        (antes: un upsert por jugador, una llamada por fila).
+        Si es de India, añade tag 'Region: India'.
+
         Args:
-            player_data: Datos del jugador
-            
+            players_data: Lote de jugadores extraídos
+
         Returns:
-            True si tuvo éxito, False si falló
+            Número de registros persistidos
         """
-        try:
-            # Añadir tag de región para jugadores de India
-            tags = []
-            if player_data["country"] == "IN":
-                tags.append("Region: India")
-            
-            # Crear registro Bronze con tags
-            raw_data = {
-                **player_data,
-                "tags": tags,
-                "scraped_at": datetime.now(timezone.utc).isoformat(),
-            }
-            
-            logger.debug("Persistencia delegada al pipeline local: cnn_brasil")
-            self.scraped_count += 1
-            return True
-            
-        except Exception as e:
-            # Ninja mode: silent error
-            logger.debug(f"Error en upsert: {e}")
-            self.error_count += 1
-            return False
+        run_ts = self._run_ts
+        raw_rows = []
+
+        for player_data in players_data:
+            try:
+                # Dedup cross-run: si el filtro ya vio esta URL, el registro
+                # fue persistido en un run anterior
+                url = player_data["profile_url"]
+                if url != self.TARGET_URL and url in self._seen:
+                    continue
+
+                # Near-dedup: distancia de Hamming ≤ 3 contra los hashes
+                # recientes ⇒ misma bio republicada con otro slug
+                h = player_data.pop("_simhash", None)
+                if h is not None:
+                    if any(bin(h ^ seen_h).count("1") <= 3 for seen_h in self._recent_hashes):
+                        continue
+                    self._recent_hashes.append(h)
+
+                # Añadir tag de región para jugadores de India
+                tags = []
+                if player_data["country"] == "IN":
+                    tags.append("Region: India")
+
+                raw_rows.append({
+                    **player_data,
+                    "tags": tags,
+                    "scraped_at": run_ts,
+                })
+                self._seen.add(url)
+            except Exception as e:
+                # Ninja mode: silent error
+                logger.debug(f"Error preparando registro: {e}")
+                self.error_count += 1
+
+        logger.debug(f"Persistencia delegada al pipeline local: cnn_brasil (lote de {len(raw_rows)})")
+        self.scraped_count += len(raw_rows)
+        self._seen.save()
+        return len(raw_rows)
     
     async def run_ninja_scrape(self) -> Dict[str, int]:
         """
@@ -269,37 +473,35 @@ class CNNBrasilNinjaScraper:
         logger.info("🥷 Iniciando scraping ninja de CNN Brasil...")
         
         start_time = datetime.now(timezone.utc)
-        
+        # Timestamp único del run: todas las filas del lote lo comparten
+        self._run_ts = start_time.isoformat()
+
         try:
-            # Configurar proxy si está habilitado
-            proxy = self._get_random_proxy()
-            
-            playwright = await async_playwright().start()
-            
-            # Lanzar browser
-            browser = await playwright.chromium.launch(
-                headless=True,
-                proxy=proxy
-            )
-            
-            # Crear página stealth
-            page = await self._create_stealth_page(browser)
-            
-            # Scraping de datos
-            players_data = await self._scrape_player_data(page)
-            
-            # Cerrar browser
-            await browser.close()
-            await playwright.stop()
-            
+            # Camino rápido: GET estático sin browser
+            players_data = await self._scrape_static()
+
+            if players_data is None:
+                # Fallback: la página requirió render JS → Playwright.
+                # El browser/contexto persiste entre runs (no se relanza).
+                await self._ensure_browser()
+                page = await self._create_stealth_page()
+
+                # Scraping de datos
+                players_data = await self._scrape_player_data(page)
+
+                await page.close()
+
             logger.info(f"✓ Extraídos {len(players_data)} jugadores")
+
+            # Dedup por profile_url: varios cards pueden apuntar al mismo
+            # jugador (o caer todos al fallback TARGET_URL)
+            before = len(players_data)
+            players_data = list({p["profile_url"]: p for p in players_data}.values())
+            if len(players_data) < before:
+                logger.info(f"↩️  {before - len(players_data)} duplicados por URL omitidos")
             
-            # Upsert en Supabase
-            for player_data in players_data:
-                await self._upsert_player_to_supabase(player_data)
-                
-                # Mini delay entre upserts
-                await asyncio.sleep(0.1)
+            # Persistir todo el lote en una sola operación Bronze
+            await self._upsert_players_batch(players_data)
             
             end_time = datetime.now(timezone.utc)
             duration = (end_time - start_time).total_seconds()
@@ -342,21 +544,28 @@ async def main():
         compression="zip"
     )
     
-    # Ejecutar scraper ninja
-    scraper = CNNBrasilNinjaScraper(use_proxies=False)  # Cambiar a True si hay proxies
-    stats = await scraper.run_ninja_scrape()
-    
-    # Output para GitHub Actions
-    print(f"::set-output name=scraped::{stats['scraped']}")
-    print(f"::set-output name=errors::{stats['errors']}")
-    print(f"::set-output name=duration::{stats['duration_seconds']}")
+    # Ejecutar scraper ninja (context manager libera el browser al salir)
+    async with CNNBrasilNinjaScraper(use_proxies=False) as scraper:  # Cambiar a True si hay proxies
+        stats = await scraper.run_ninja_scrape()
     
-    # Exit code basado en resultados
-    if stats['scraped'] > 0:
-        exit(0)  # Éxito
-    else:
-        exit(1)  # Fallo
+    # Output para GitHub Actions vía $GITHUB_OUTPUT (la sintaxis
+    # ::set-output está deprecada y los runners nuevos la ignoran)
+    output_file = os.environ.get("GITHUB_OUTPUT")
+    if output_file:
+        with open(output_file, "a") as f:
+            f.write(
+                f"scraped={stats['scraped']}\n"
+                f"errors={stats['errors']}\n"
+                f"duration={stats['duration_seconds']}\n"
+            )
 
 
 if __name__ == "__main__":
+    # uvloop: event loop drop-in ~2-4x más rápido en cargas I/O-bound
+    # (no disponible en Windows; el fallback es el loop por defecto)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
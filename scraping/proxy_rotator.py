@@ -3,11 +3,59 @@ Scraper mejorado con rotación de proxies real usando proxy services
 Integración con servicios como Bright Data, ScraperAPI, etc.
 """
 import asyncio
+import itertools
 import os
+import random
+import threading
 from typing import Optional, Dict
 from playwright.async_api import async_playwright, Browser, ProxySettings
 from loguru import logger
 
+# Script anti-detección precompilado una vez a nivel de módulo: se reenvía
+# por CDP en cada add_init_script, así que no tiene sentido reconstruir el
+# string por página
+_STEALTH_JS = """
+    // Ocultar webdriver
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Chrome runtime
+    window.navigator.chrome = {
+        runtime: {},
+    };
+
+    // Plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    // Languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['pt-BR', 'pt', 'en-US', 'en'],
+    });
+
+    // Permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+
+    // Ocultar automation
+    delete navigator.__proto__.webdriver;
+
+    // Mock de conexión
+    Object.defineProperty(navigator, 'connection', {
+        get: () => ({
+            effectiveType: '4g',
+            downlink: 10,
+            rtt: 50
+        })
+    });
+"""
+
 
 class ProxyRotator:
     """
@@ -27,8 +75,14 @@ class ProxyRotator:
                 - "custom": Lista personalizada
         """
         self.proxy_service = proxy_service
-        self.current_proxy_index = 0
         self.proxies = self._load_proxies()
+        # itertools.cycle + lock: la rotación con índice manual no era
+        # atómica y bajo scrapers concurrentes repartía el mismo proxy
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(self.proxies) if self.proxies else None
+        self._health: Dict[str, Dict[str, int]] = {
+            p["server"]: {"ok": 1, "fail": 0} for p in self.proxies
+        }
     
     def _load_proxies(self) -> list:
         """Carga la lista de proxies según el servicio configurado"""
@@ -81,19 +135,52 @@ class ProxyRotator:
     
     def get_next_proxy(self) -> Optional[Dict[str, str]]:
         """
-        Obtiene el siguiente proxy en rotación
-        
+        Obtiene el siguiente proxy en rotación (round-robin atómico)
+
         Returns:
             Configuración del proxy o None si no hay proxies
         """
         if not self.proxies:
             return None
-        
-        proxy = self.proxies[self.current_proxy_index]
-        self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxies)
-        
-        return proxy
-    
+
+        with self._lock:
+            return next(self._cycle)
+
+    def report(self, proxy: Optional[Dict[str, str]], success: bool) -> None:
+        """
+        Registra el resultado de usar un proxy (para la selección ponderada)
+
+        Args:
+            proxy: Configuración devuelta por get_next_proxy/best_proxy
+            success: True si la request salió bien, False ante 429/5xx/timeout
+        """
+        if not proxy:
+            return
+        stats = self._health.get(proxy.get("server", ""))
+        if stats is None:
+            return
+        with self._lock:
+            stats["ok" if success else "fail"] += 1
+
+    def best_proxy(self) -> Optional[Dict[str, str]]:
+        """
+        Selección aleatoria ponderada por salud: los proxies con más éxitos
+        reciben más carga y los que acumulan fallos se usan menos
+
+        Returns:
+            Configuración del proxy o None si no hay proxies
+        """
+        if not self.proxies:
+            return None
+
+        with self._lock:
+            weights = [
+                self._health[p["server"]]["ok"]
+                / (self._health[p["server"]]["ok"] + self._health[p["server"]]["fail"] + 1)
+                for p in self.proxies
+            ]
+        return random.choices(self.proxies, weights=weights, k=1)[0]
+
     def has_proxies(self) -> bool:
         """Verifica si hay proxies disponibles"""
         return len(self.proxies) > 0
@@ -147,52 +234,23 @@ class StealthBrowser:
     async def apply_stealth_scripts(page):
         """
         Aplica scripts anti-detección a una página
-        
+
         Args:
             page: Página de Playwright
         """
-        # Script completo anti-detección
-        await page.add_init_script("""
-            // Ocultar webdriver
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Chrome runtime
-            window.navigator.chrome = {
-                runtime: {},
-            };
-            
-            // Plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-            
-            // Languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['pt-BR', 'pt', 'en-US', 'en'],
-            });
-            
-            // Permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-            
-            // Ocultar automation
-            delete navigator.__proto__.webdriver;
-            
-            // Mock de conexión
-            Object.defineProperty(navigator, 'connection', {
-                get: () => ({
-                    effectiveType: '4g',
-                    downlink: 10,
-                    rtt: 50
-                })
-            });
-        """)
+        await page.add_init_script(_STEALTH_JS)
+
+    @staticmethod
+    async def apply_stealth_to_context(context):
+        """
+        Aplica los scripts anti-detección una sola vez a nivel de contexto:
+        todas las páginas que se abran en él los heredan, sin un
+        add_init_script (una llamada CDP) por página
+
+        Args:
+            context: BrowserContext de Playwright
+        """
+        await context.add_init_script(_STEALTH_JS)
 
 
 # Ejemplo de uso con el scraper ninja
@@ -211,12 +269,13 @@ async def example_with_proxy():
         proxy=proxy
     )
     
-    # Crear página
-    page = await browser.new_page()
-    
-    # Aplicar scripts stealth
-    await StealthBrowser.apply_stealth_scripts(page)
-    
+    # Crear contexto con stealth aplicado una sola vez
+    context = await browser.new_context()
+    await StealthBrowser.apply_stealth_to_context(context)
+
+    # Las páginas del contexto heredan los scripts stealth
+    page = await context.new_page()
+
     # Usar la página...
     await page.goto("https://www.cnnbrasil.com.br/esportes/outros-esportes/e-sports/")
     
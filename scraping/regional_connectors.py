@@ -16,9 +16,10 @@ Date: 2026-04-16
 
 import asyncio
 import random
+import re
 import urllib.robotparser
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 from datetime import datetime, timezone
 from urllib.parse import urlparse, urljoin
 
@@ -248,14 +249,21 @@ class BaseRegionalConnector(ABC):
         """Obtiene el Accept-Language apropiado (implementar en subclases)"""
         pass
     
-    def _map_to_supabase_format(self, player_data: Dict[str, Any], source: str) -> Dict[str, Any]:
+    def _map_to_supabase_format(
+        self,
+        player_data: Dict[str, Any],
+        source: str,
+        scraped_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Mapea datos scraped al formato JSON de Supabase Bronze
-        
+
         Args:
             player_data: Datos del jugador
             source: Fuente del scraping
-            
+            scraped_at: Timestamp ISO precomputado (los lotes lo comparten
+                en vez de llamar a datetime.now() por registro)
+
         Returns:
             Datos en formato Bronze
         """
@@ -263,30 +271,43 @@ class BaseRegionalConnector(ABC):
             "raw_data": player_data,
             "source": source,
             "source_url": player_data.get("profile_url", ""),
-            "scraped_at": datetime.now(timezone.utc).isoformat(),
+            "scraped_at": scraped_at or datetime.now(timezone.utc).isoformat(),
             "processing_status": "pending"
         }
     
-    async def insert_to_bronze(self, player_profile: PlayerProfile, source: str) -> bool:
+    @staticmethod
+    def _as_player_dict(profile: Union[PlayerProfile, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Normaliza un registro a dict para la capa Bronze.
+
+        Los dicts ya scraped pasan directo: no tiene sentido reconstruir un
+        `PlayerProfile` (con todo su dispatch de validadores por campo) solo
+        para volver a serializarlo en la línea siguiente.
+        """
+        if isinstance(profile, dict):
+            return profile
+        return profile.model_dump(mode='json', exclude_none=True)
+
+    async def insert_to_bronze(self, player_profile: Union[PlayerProfile, Dict[str, Any]], source: str) -> bool:
         """
         Inserta un perfil de jugador en la capa Bronze
-        
+
         Args:
-            player_profile: Perfil del jugador
+            player_profile: Perfil del jugador (modelo o dict ya scraped)
             source: Fuente del scraping
-            
+
         Returns:
             True si tuvo éxito, False si falló
         """
         try:
-            # Convertir a diccionario
-            player_dict = player_profile.model_dump(mode='json')
-            
+            # Convertir a diccionario (pass-through si ya es dict)
+            player_dict = self._as_player_dict(player_profile)
+
             # Mapear a formato Bronze
             bronze_data = self._map_to_supabase_format(player_dict, source)
-            
+
             self.scraped_count += 1
-            logger.success(f"✓ Perfil procesado en Bronze: {player_profile.nickname} ({source})")
+            logger.success(f"✓ Perfil procesado en Bronze: {player_dict.get('nickname', '?')} ({source})")
             return True
             
         except Exception as e:
@@ -294,6 +315,59 @@ class BaseRegionalConnector(ABC):
             logger.error(f"✗ Error insertando en Bronze: {e}")
             return False
 
+    async def insert_many_to_bronze(
+        self,
+        player_profiles: List[Union[PlayerProfile, Dict[str, Any]]],
+        source: str
+    ) -> int:
+        """
+        Inserta un lote de perfiles en la capa Bronze en una sola operación.
+        Evita el patrón de un INSERT por jugador: todos los registros del lote
+        comparten timestamp y se procesan juntos. Acepta modelos o dicts ya
+        scraped; los dicts pasan directo sin validación Pydantic.
+
+        Args:
+            player_profiles: Perfiles del lote (modelos o dicts)
+            source: Fuente del scraping
+
+        Returns:
+            Número de perfiles procesados exitosamente
+        """
+        if not player_profiles:
+            return 0
+
+        # Dedup en memoria: correr varios scrapers sobre la misma región
+        # puede producir el mismo (nickname, game, server) más de una vez,
+        # y cada duplicado sería un insert desperdiciado.
+        seen = set()
+        deduped: List[Dict[str, Any]] = []
+        for profile in player_profiles:
+            row = self._as_player_dict(profile)
+            key = (row.get("nickname"), str(row.get("game")), row.get("server"))
+            if key in seen:
+                continue
+            seen.add(key)
+            deduped.append(row)
+
+        skipped = len(player_profiles) - len(deduped)
+        if skipped:
+            logger.info(f"↩️  {skipped} duplicados omitidos antes de Bronze")
+
+        batch_ts = datetime.now(timezone.utc).isoformat()
+        inserted = 0
+
+        for row in deduped:
+            try:
+                bronze_data = self._map_to_supabase_format(row, source, scraped_at=batch_ts)
+                inserted += 1
+            except Exception as e:
+                self.error_count += 1
+                logger.error(f"✗ Error preparando {row.get('nickname', '?')} para Bronze: {e}")
+
+        self.scraped_count += inserted
+        logger.success(f"✓ Lote procesado en Bronze: {inserted}/{len(player_profiles)} perfiles ({source})")
+        return inserted
+
 
 class DakGGConnector(BaseRegionalConnector):
     """
@@ -319,7 +393,42 @@ class DakGGConnector(BaseRegionalConnector):
     
     def _get_accept_language(self) -> str:
         return "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
-    
+
+    # Extracción en una sola pasada dentro del browser: cada
+    # query_selector/inner_text es un round-trip CDP, así que agrupamos
+    # todos los textos candidatos (y los campeones) en un solo evaluate
+    # y el parsing queda del lado Python.
+    _EXTRACT_JS = """
+        () => {
+            const grab = (sels) => sels.map(s => {
+                const el = document.querySelector(s);
+                return el && el.innerText ? el.innerText.trim() : '';
+            }).filter(t => t);
+            const champs = [];
+            for (const s of ['.champion-list .champion', "[class*='champion-item']", "[class*='most-played']", '.most-champion']) {
+                const els = document.querySelectorAll(s);
+                if (els.length) {
+                    for (const el of Array.from(els).slice(0, 3)) {
+                        const img = el.querySelector('img');
+                        const wr = el.querySelector("[class*='winrate'], .win-rate");
+                        champs.push({
+                            name: img ? (img.getAttribute('alt') || '') : (el.innerText || '').trim().split('\\n')[0],
+                            wr_text: wr && wr.innerText ? wr.innerText : ''
+                        });
+                    }
+                    break;
+                }
+            }
+            return {
+                nickname_texts: grab(['h1', '.summoner-name', "[class*='name']", "[class*='summoner']"]),
+                rank_texts: grab(['.tier', "[class*='tier']", "[class*='rank']", '.rank']),
+                winrate_texts: grab(['.win-rate', "[class*='winrate']", "[class*='win']", '.winrate']),
+                kda_texts: grab(['.kda', "[class*='kda']", "[class*='KDA']"]),
+                champions: champs
+            };
+        }
+    """
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=30),
@@ -361,116 +470,57 @@ class DakGGConnector(BaseRegionalConnector):
             
             # Esperar a que cargue el contenido principal
             await page.wait_for_selector("div[class*='profile'], .summoner-info, [class*='player']", timeout=15000)
-            
+
+            # Un solo round-trip CDP para todos los campos candidatos
+            extracted = await page.evaluate(self._EXTRACT_JS)
+
             # Extraer nickname (puede estar en hangul)
             nickname = summoner_name
-            for selector in ["h1", ".summoner-name", "[class*='name']", "[class*='summoner']"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        if text and text.strip():
-                            nickname = text.strip()
-                            break
-                except:
-                    continue
-            
+            for text in extracted.get("nickname_texts", []):
+                if text:
+                    nickname = text
+                    break
+
             # Extraer tier/rank
             rank = "Unranked"
-            for selector in [".tier", "[class*='tier']", "[class*='rank']", ".rank"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        if text and any(r in text for r in ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Diamond", "Master", "Grandmaster", "Challenger", "아이언", "브론즈", "실버", "골드", "플래티넘", "다이아", "마스터", "그랜드마스터", "챌린저"]):
-                            rank = text.strip()
-                            break
-                except:
-                    continue
-            
+            for text in extracted.get("rank_texts", []):
+                if any(r in text for r in ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Diamond", "Master", "Grandmaster", "Challenger", "아이언", "브론즈", "실버", "골드", "플래티넘", "다이아", "마스터", "그랜드마스터", "챌린저"]):
+                    rank = text
+                    break
+
             # Extraer WinRate
             win_rate = 50.0
-            for selector in [".win-rate", "[class*='winrate']", "[class*='win']", ".winrate"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        import re
-                        match = re.search(r'(\d+)%', text)
-                        if match:
-                            win_rate = float(match.group(1))
-                            break
-                except:
-                    continue
-            
+            for text in extracted.get("winrate_texts", []):
+                match = re.search(r'(\d+)%', text)
+                if match:
+                    win_rate = float(match.group(1))
+                    break
+
             logger.info(f"📊 WinRate extraído: {win_rate}%")
-            
+
             # Extraer KDA
             kda = 2.0
-            for selector in [".kda", "[class*='kda']", "[class*='KDA']"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        import re
-                        match = re.search(r'(\d+\.?\d*)', text)
-                        if match:
-                            kda = float(match.group(1))
-                            break
-                except:
-                    continue
-            
+            for text in extracted.get("kda_texts", []):
+                match = re.search(r'(\d+\.?\d*)', text)
+                if match:
+                    kda = float(match.group(1))
+                    break
+
             # Extraer Most Played Hero/Champion
             top_champions = []
-            champion_selectors = [
-                ".champion-list .champion",
-                "[class*='champion-item']",
-                "[class*='most-played']",
-                ".most-champion"
-            ]
-            
-            for selector in champion_selectors:
-                try:
-                    champ_elements = await page.query_selector_all(selector)
-                    if champ_elements:
-                        for idx, elem in enumerate(champ_elements[:3]):
-                            # Extraer nombre del campeón
-                            champ_name = "Unknown"
-                            try:
-                                name_elem = await elem.query_selector("img")
-                                if name_elem:
-                                    champ_name = await name_elem.get_attribute("alt") or "Unknown"
-                                else:
-                                    text = await elem.inner_text()
-                                    if text:
-                                        champ_name = text.strip().split("\n")[0]
-                            except:
-                                pass
-                            
-                            # Extraer stats del campeón
-                            champ_wr = win_rate
-                            try:
-                                wr_elem = await elem.query_selector("[class*='winrate'], .win-rate")
-                                if wr_elem:
-                                    wr_text = await wr_elem.inner_text()
-                                    import re
-                                    match = re.search(r'(\d+)%', wr_text)
-                                    if match:
-                                        champ_wr = float(match.group(1))
-                            except:
-                                pass
-                            
-                            top_champions.append(Champion(
-                                name=champ_name,
-                                games_played=50 - (idx * 10),  # Estimado
-                                win_rate=champ_wr
-                            ))
-                        
-                        if top_champions:
-                            break
-                except:
-                    continue
-            
+            for idx, champ in enumerate(extracted.get("champions", [])[:3]):
+                champ_name = champ.get("name") or "Unknown"
+                champ_wr = win_rate
+                match = re.search(r'(\d+)%', champ.get("wr_text", ""))
+                if match:
+                    champ_wr = float(match.group(1))
+
+                top_champions.append(Champion(
+                    name=champ_name,
+                    games_played=50 - (idx * 10),  # Estimado
+                    win_rate=champ_wr
+                ))
+
             # Si no se encontraron campeones, crear uno genérico
             if not top_champions:
                 top_champions = [Champion(name="Unknown", games_played=50, win_rate=win_rate)]
@@ -545,7 +595,40 @@ class ScoreGGConnector(BaseRegionalConnector):
     
     def _get_accept_language(self) -> str:
         return "zh-CN,zh;q=0.9,en-US;q=0.8,en;q=0.7"
-    
+
+    # Igual que en DakGGConnector: un solo evaluate agrupa todos los
+    # textos candidatos (selectores en inglés y chino) en un round-trip.
+    _EXTRACT_JS = """
+        () => {
+            const grab = (sels) => sels.map(s => {
+                const el = document.querySelector(s);
+                return el && el.innerText ? el.innerText.trim() : '';
+            }).filter(t => t);
+            const champs = [];
+            for (const s of ['.champion-list .champion', "[class*='hero']", "[class*='champion']", "[class*='\\u82f1\\u96c4']"]) {
+                const els = document.querySelectorAll(s);
+                if (els.length) {
+                    for (const el of Array.from(els).slice(0, 3)) {
+                        const img = el.querySelector('img');
+                        const wr = el.querySelector("[class*='winrate'], [class*='win'], [class*='\\u80dc\\u7387']");
+                        champs.push({
+                            name: img ? (img.getAttribute('alt') || img.getAttribute('title') || '') : (el.innerText || '').trim().split('\\n')[0],
+                            wr_text: wr && wr.innerText ? wr.innerText : ''
+                        });
+                    }
+                    break;
+                }
+            }
+            return {
+                nickname_texts: grab(['h1', '.player-name', "[class*='name']", "[class*='player']"]),
+                rank_texts: grab(['.tier', "[class*='tier']", "[class*='rank']", '.rank']),
+                winrate_texts: grab(['.win-rate', "[class*='winrate']", "[class*='win']", "[class*='\\u80dc\\u7387']"]),
+                kda_texts: grab(['.kda', "[class*='kda']", "[class*='KDA']"]),
+                champions: champs
+            };
+        }
+    """
+
     @retry(
         stop=stop_after_attempt(5),  # Más reintentos para China
         wait=wait_exponential(multiplier=2, min=4, max=60),
@@ -590,116 +673,57 @@ class ScoreGGConnector(BaseRegionalConnector):
             
             # Esperar contenido (más tiempo para China)
             await page.wait_for_selector("div[class*='player'], .player-info, [class*='profile']", timeout=20000)
-            
+
+            # Un solo round-trip CDP para todos los campos candidatos
+            extracted = await page.evaluate(self._EXTRACT_JS)
+
             # Extraer nickname (puede estar en caracteres chinos)
             nickname = player_id
-            for selector in ["h1", ".player-name", "[class*='name']", "[class*='player']"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        if text and text.strip():
-                            nickname = text.strip()
-                            break
-                except:
-                    continue
-            
-            # Extraer tier/rank
+            for text in extracted.get("nickname_texts", []):
+                if text:
+                    nickname = text
+                    break
+
+            # Extraer tier/rank (soportar ranks en chino e inglés)
             rank = "Unranked"
-            for selector in [".tier", "[class*='tier']", "[class*='rank']", ".rank"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        # Soportar ranks en chino e inglés
-                        if text and (any(r in text for r in ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Diamond", "Master", "Grandmaster", "Challenger"]) or len(text) < 20):
-                            rank = text.strip()
-                            break
-                except:
-                    continue
-            
+            for text in extracted.get("rank_texts", []):
+                if any(r in text for r in ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Diamond", "Master", "Grandmaster", "Challenger"]) or len(text) < 20:
+                    rank = text
+                    break
+
             # Extraer WinRate
             win_rate = 50.0
-            for selector in [".win-rate", "[class*='winrate']", "[class*='win']", "[class*='胜率']"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        import re
-                        match = re.search(r'(\d+)%', text)
-                        if match:
-                            win_rate = float(match.group(1))
-                            break
-                except:
-                    continue
-            
+            for text in extracted.get("winrate_texts", []):
+                match = re.search(r'(\d+)%', text)
+                if match:
+                    win_rate = float(match.group(1))
+                    break
+
             logger.info(f"📊 WinRate extraído: {win_rate}%")
-            
+
             # Extraer KDA
             kda = 2.0
-            for selector in [".kda", "[class*='kda']", "[class*='KDA']"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        import re
-                        match = re.search(r'(\d+\.?\d*)', text)
-                        if match:
-                            kda = float(match.group(1))
-                            break
-                except:
-                    continue
-            
+            for text in extracted.get("kda_texts", []):
+                match = re.search(r'(\d+\.?\d*)', text)
+                if match:
+                    kda = float(match.group(1))
+                    break
+
             # Extraer Most Played Hero
             top_champions = []
-            champion_selectors = [
-                ".champion-list .champion",
-                "[class*='hero']",
-                "[class*='champion']",
-                "[class*='英雄']"
-            ]
-            
-            for selector in champion_selectors:
-                try:
-                    champ_elements = await page.query_selector_all(selector)
-                    if champ_elements:
-                        for idx, elem in enumerate(champ_elements[:3]):
-                            champ_name = "Unknown"
-                            try:
-                                # Intentar obtener de imagen
-                                name_elem = await elem.query_selector("img")
-                                if name_elem:
-                                    champ_name = await name_elem.get_attribute("alt") or await name_elem.get_attribute("title") or "Unknown"
-                                else:
-                                    text = await elem.inner_text()
-                                    if text:
-                                        champ_name = text.strip().split("\n")[0]
-                            except:
-                                pass
-                            
-                            champ_wr = win_rate
-                            try:
-                                wr_elem = await elem.query_selector("[class*='winrate'], [class*='win'], [class*='胜率']")
-                                if wr_elem:
-                                    wr_text = await wr_elem.inner_text()
-                                    import re
-                                    match = re.search(r'(\d+)%', wr_text)
-                                    if match:
-                                        champ_wr = float(match.group(1))
-                            except:
-                                pass
-                            
-                            top_champions.append(Champion(
-                                name=champ_name,
-                                games_played=100 - (idx * 20),
-                                win_rate=champ_wr
-                            ))
-                        
-                        if top_champions:
-                            break
-                except:
-                    continue
-            
+            for idx, champ in enumerate(extracted.get("champions", [])[:3]):
+                champ_name = champ.get("name") or "Unknown"
+                champ_wr = win_rate
+                match = re.search(r'(\d+)%', champ.get("wr_text", ""))
+                if match:
+                    champ_wr = float(match.group(1))
+
+                top_champions.append(Champion(
+                    name=champ_name,
+                    games_played=100 - (idx * 20),
+                    win_rate=champ_wr
+                ))
+
             if not top_champions:
                 top_champions = [Champion(name="Unknown", games_played=50, win_rate=win_rate)]
             
@@ -756,16 +780,18 @@ async def scrape_dak_gg_players(summoner_names: List[str], game: str = "lol") ->
             try:
                 profile = await connector.scrape_player(name, game)
                 if profile:
-                    await connector.insert_to_bronze(profile, "dak.gg")
                     profiles.append(profile)
-                
+
                 # Delay entre jugadores
                 await asyncio.sleep(random.uniform(2, 4))
-                
+
             except Exception as e:
                 logger.error(f"Error scraping {name}: {e}")
                 continue
-    
+
+        # Insertar todo el lote en una sola operación Bronze
+        await connector.insert_many_to_bronze(profiles, "dak.gg")
+
     return profiles
 
 
@@ -788,16 +814,18 @@ async def scrape_scoregg_players(player_ids: List[str], game: str = "lol", use_p
             try:
                 profile = await connector.scrape_player(player_id, game)
                 if profile:
-                    await connector.insert_to_bronze(profile, "scoregg.com")
                     profiles.append(profile)
-                
+
                 # Delay más largo para China
                 await asyncio.sleep(random.uniform(4, 8))
-                
+
             except Exception as e:
                 logger.error(f"Error scraping {player_id}: {e}")
                 continue
-    
+
+        # Insertar todo el lote en una sola operación Bronze
+        await connector.insert_many_to_bronze(profiles, "scoregg.com")
+
     return profiles
 
 
@@ -149,6 +149,7 @@ class RiotAPIClient:
         
         # 2. Convertir a PlayerProfile
         players = []
+        scraped_at = datetime.now(timezone.utc)  # un timestamp por lote, no por fila
         for idx, entry in enumerate(entries[:100], 1):  # Limitar a top 100
             try:
                 # Datos básicos de la API
@@ -169,7 +170,7 @@ class RiotAPIClient:
                     region=self.region,
                     game_title="League of Legends",
                     source_url=f"https://developer.riotgames.com/apis#league-v4",
-                    scraped_at=datetime.now(timezone.utc)
+                    scraped_at=scraped_at
                 )
                 
                 players.append(player)
@@ -203,6 +204,7 @@ class RiotAPIClient:
         logger.info(f"📊 {len(entries)} jugadores Grandmaster encontrados")
         
         players = []
+        scraped_at = datetime.now(timezone.utc)  # un timestamp por lote, no por fila
         for idx, entry in enumerate(entries[:100], 101):  # Rank 101-200
             try:
                 player = PlayerProfile(
@@ -215,7 +217,7 @@ class RiotAPIClient:
                     region=self.region,
                     game_title="League of Legends",
                     source_url="https://developer.riotgames.com/apis#league-v4",
-                    scraped_at=datetime.now(timezone.utc)
+                    scraped_at=scraped_at
                 )
                 players.append(player)
             except:
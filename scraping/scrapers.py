@@ -3,45 +3,130 @@ Scrapers base y específicos para diferentes fuentes
 Motor de ingesta asíncrono con Playwright
 """
 import asyncio
+import pathlib
+import re
+import time
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from playwright.async_api import async_playwright, Browser, Page
+
+import httpx
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from core.models import PlayerProfile, GameTitle, CountryCode, Champion, PlayerStats
 from core.country_detector import detect_country
-from core.config import settings
+from core.config import HOT
+from scraping.strategic_adapters import AsyncTokenBucket
+
+# Recursos que el scraper nunca lee: abortarlos ahorra la mayor parte de los
+# bytes por página (imágenes/fuentes de OP.GG) y acelera el load
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+
+async def _block_static_resources(route):
+    """Handler de page.route: aborta recursos estáticos, deja pasar el resto"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Directorio donde cada scraper persiste cookies/localStorage entre corridas:
+# evita repetir challenges JS y diálogos de consentimiento en cada arranque
+_STORAGE_STATE_DIR = pathlib.Path(__file__).parent / ".storage_state"
+
+
+# Caché de perfiles por (scraper, identificador) con TTL: un perfil de OP.GG
+# cambia en horas, no en segundos, así que re-scrapearlo en la misma ventana
+# solo quema rate limit. Compartido entre instancias del mismo proceso.
+_PROFILE_CACHE: dict = {}
+_PROFILE_CACHE_TTL_S = 6 * 3600
+
+
+def _cache_get(key) -> Optional[PlayerProfile]:
+    """Devuelve el perfil cacheado si sigue dentro del TTL, si no None"""
+    entry = _PROFILE_CACHE.get(key)
+    if entry is None:
+        return None
+    cached_at, profile = entry
+    if time.monotonic() - cached_at > _PROFILE_CACHE_TTL_S:
+        del _PROFILE_CACHE[key]
+        return None
+    return profile
+
+
+def _cache_put(key, profile: PlayerProfile) -> None:
+    _PROFILE_CACHE[key] = (time.monotonic(), profile)
 
 
 class BaseScraper(ABC):
     """Clase base para todos los scrapers"""
     
     def __init__(self):
+        self.playwright = None
         self.browser: Optional[Browser] = None
-        self.rate_limit_delay = settings.rate_limit_delay
+        self.context: Optional[BrowserContext] = None
+        self.rate_limit_delay = HOT.rate_limit_delay
+        # Límite de scrapes en vuelo — el workload es I/O-bound (esperas de
+        # red de Playwright), así que N concurrentes ≈ N veces más rápido
+        self.sem = asyncio.BoundedSemaphore(HOT.max_concurrent_requests)
+        # Token bucket: a diferencia de un sleep fijo, el tiempo que tarda la
+        # propia request cuenta para el intervalo — no se paga el delay doble
+        self.limiter = AsyncTokenBucket(
+            rate_per_minute=max(1, int(60 / max(self.rate_limit_delay, 0.1)))
+        )
         
+    def _storage_state_path(self) -> pathlib.Path:
+        """Archivo de storage state propio de cada subclase de scraper"""
+        return _STORAGE_STATE_DIR / f"{self.__class__.__name__}.json"
+
     async def __aenter__(self):
-        """Context manager: inicializar browser"""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=True)
+        """Context manager: inicializar browser y contexto compartido"""
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=True)
+        # Un solo BrowserContext por scraper: headers/cookies/locale se
+        # configuran una vez y se comparten entre todas las páginas.
+        # Si hay storage state de una corrida anterior, se reutiliza.
+        state_path = self._storage_state_path()
+        self.context = await self.browser.new_context(
+            user_agent=HOT.user_agent,
+            extra_http_headers={
+                "Accept-Language": "en-US,en;q=0.9,ko;q=0.8,zh;q=0.7"
+            },
+            locale="en-US",
+            storage_state=str(state_path) if state_path.exists() else None,
+        )
+        # Un solo route a nivel de contexto aplica a todas las páginas
+        await self.context.route("**/*", _block_static_resources)
+        # El extractor JS del scraper se registra una vez por contexto:
+        # V8 lo parsea una sola vez y cada scrape solo lo invoca
+        extractor_js = getattr(self, "_EXTRACT_JS", None)
+        if extractor_js:
+            await self.context.add_init_script(f"window.__grExtract = {extractor_js};")
         logger.info(f"🌐 Browser iniciado para {self.__class__.__name__}")
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager: cerrar browser"""
+        """Context manager: cerrar contexto, browser y playwright"""
+        if self.context:
+            # Persistir cookies/localStorage para la próxima corrida
+            try:
+                _STORAGE_STATE_DIR.mkdir(parents=True, exist_ok=True)
+                await self.context.storage_state(path=str(self._storage_state_path()))
+            except Exception as e:
+                logger.debug(f"No se pudo persistir storage state: {e}")
+            await self.context.close()
         if self.browser:
             await self.browser.close()
-            logger.info(f"🌐 Browser cerrado para {self.__class__.__name__}")
-    
+        if self.playwright:
+            await self.playwright.stop()
+        logger.info(f"🌐 Browser cerrado para {self.__class__.__name__}")
+
     async def create_page(self) -> Page:
-        """Crea una nueva página con configuración personalizada"""
-        page = await self.browser.new_page()
-        await page.set_extra_http_headers({
-            "User-Agent": settings.user_agent,
-            "Accept-Language": "en-US,en;q=0.9,ko;q=0.8,zh;q=0.7"
-        })
-        return page
+        """Crea una nueva página dentro del contexto compartido"""
+        return await self.context.new_page()
     
     @abstractmethod
     async def scrape_player(self, identifier: str) -> Optional[PlayerProfile]:
@@ -58,86 +143,107 @@ class BaseScraper(ABC):
     
     async def scrape_players(self, identifiers: List[str]) -> List[PlayerProfile]:
         """
-        Scrapea múltiples jugadores con rate limiting
-        
+        Scrapea múltiples jugadores de forma concurrente
+
+        El semáforo limita los scrapes en vuelo a
+        HOT.max_concurrent_requests, que pasa a ser el mecanismo de
+        rate limiting (antes: un sleep fijo entre jugadores secuenciales).
+
         Args:
             identifiers: Lista de identificadores
-            
+
         Returns:
             Lista de PlayerProfiles exitosos
         """
-        profiles = []
-        
-        for i, identifier in enumerate(identifiers):
-            logger.info(f"📊 Scraping {i+1}/{len(identifiers)}: {identifier}")
-            
-            try:
+        async def _one(identifier: str) -> Optional[PlayerProfile]:
+            cache_key = (self.__class__.__name__, identifier)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"♻️  Cache hit: {identifier}")
+                return cached
+            async with self.sem:
+                await self.limiter.acquire()
+                logger.info(f"📊 Scraping: {identifier}")
                 profile = await self.scrape_player(identifier)
                 if profile:
-                    profiles.append(profile)
-                    logger.success(f"✓ {profile.nickname} scraped exitosamente")
-            except Exception as e:
-                logger.error(f"✗ Error scraping {identifier}: {e}")
-            
-            # Rate limiting
-            if i < len(identifiers) - 1:
-                await asyncio.sleep(self.rate_limit_delay)
-        
+                    _cache_put(cache_key, profile)
+                return profile
+
+        results = await asyncio.gather(
+            *(_one(identifier) for identifier in identifiers),
+            return_exceptions=True,
+        )
+
+        profiles = []
+        for identifier, result in zip(identifiers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"✗ Error scraping {identifier}: {result}")
+            elif result:
+                profiles.append(result)
+                logger.success(f"✓ {result.nickname} scraped exitosamente")
+
         logger.info(f"🎯 Total scraped: {len(profiles)}/{len(identifiers)}")
         return profiles
 
 
 class LiquipediaScraper(BaseScraper):
     """Scraper para Liquipedia (India, Vietnam, SEA)"""
-    
+
     BASE_URL = "https://liquipedia.net"
-    
+
+    # Extracción completa en una sola pasada dentro del browser:
+    # cada query_selector/inner_text es un round-trip CDP, así que juntamos
+    # todo en un page.evaluate que devuelve un único objeto JSON.
+    _EXTRACT_JS = """
+        () => ({
+            nickname: document.querySelector('h1.firstHeading')?.innerText?.trim() || '',
+            country_title: document.querySelector('span.flag a')?.getAttribute('title') || '',
+            has_infobox: !!document.querySelector('div.infobox-center'),
+        })
+    """
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def scrape_player(self, player_url: str) -> Optional[PlayerProfile]:
         """
         Scrapea un jugador de Liquipedia
-        
+
         Args:
             player_url: URL del perfil en Liquipedia
-            
+
         Returns:
             PlayerProfile o None
         """
         page = await self.create_page()
-        
+
         try:
             await page.goto(player_url, wait_until="domcontentloaded")
-            
-            # Extraer nickname
-            nickname_element = await page.query_selector("h1.firstHeading")
-            nickname = await nickname_element.inner_text() if nickname_element else "Unknown"
-            
-            # Extraer país desde bandera
-            flag_element = await page.query_selector("span.flag a")
-            country_text = await flag_element.get_attribute("title") if flag_element else ""
-            
+
+            # Un solo round-trip al browser para nickname, bandera e infobox
+            # (el extractor ya está registrado en el contexto)
+            extracted = await page.evaluate("window.__grExtract()")
+            nickname = extracted.get("nickname") or "Unknown"
+            country_text = extracted.get("country_title") or ""
+
             # Detectar país
             country = detect_country(
                 profile_text=country_text,
                 url=player_url
             )
             
-            # Extraer información del infobox
-            infobox = await page.query_selector("div.infobox-center")
-            
             # Placeholder para stats (Liquipedia no siempre tiene stats detallados)
             # Aquí deberías implementar la lógica específica según el juego
-            stats = PlayerStats(
+            # model_construct: son literales confiables, no hace falta validarlos
+            stats = PlayerStats.model_construct(
                 win_rate=50.0,  # Placeholder
                 kda=2.5,  # Placeholder
                 games_analyzed=100
             )
-            
+
             # Placeholder para top champions
             top_champions = [
-                Champion(name="Champion 1", games_played=50, win_rate=55.0),
-                Champion(name="Champion 2", games_played=30, win_rate=52.0),
-                Champion(name="Champion 3", games_played=20, win_rate=48.0),
+                Champion.model_construct(name="Champion 1", games_played=50, win_rate=55.0),
+                Champion.model_construct(name="Champion 2", games_played=30, win_rate=52.0),
+                Champion.model_construct(name="Champion 3", games_played=20, win_rate=48.0),
             ]
             
             # Crear perfil
@@ -163,9 +269,101 @@ class LiquipediaScraper(BaseScraper):
 
 class OPGGScraper(BaseScraper):
     """Scraper para OP.GG (Korea, Vietnam)"""
-    
+
     BASE_URL = "https://www.op.gg"
-    
+
+    def __init__(self):
+        super().__init__()
+        # Vía rápida sin Chromium: la API JSON interna de OP.GG vía httpx
+        # (mismo endpoint que usa asia_adapters.OPGGAdapter). El browser
+        # queda solo como fallback para 403 / challenge JS.
+        self._http: Optional[httpx.AsyncClient] = None
+        self._json_adapters: dict = {}
+
+    def _json_adapter(self, region: str):
+        """Devuelve (creando si hace falta) el OPGGAdapter httpx de la región"""
+        from scraping.asia_adapters import OPGGAdapter
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=20,
+                follow_redirects=True,
+            )
+        if region not in self._json_adapters:
+            self._json_adapters[region] = OPGGAdapter(client=self._http, region=region)
+        return self._json_adapters[region]
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _scrape_via_json(self, summoner_name: str, region: str) -> Optional[PlayerProfile]:
+        """Intenta construir el perfil desde la API JSON (sin browser)"""
+        try:
+            data = await self._json_adapter(region).fetch_player(summoner_name, game="lol")
+        except Exception as e:
+            logger.debug(f"OP.GG JSON falló para {summoner_name}: {e}")
+            return None
+        if not data:
+            return None
+
+        stats_data = data.get("stats") or {}
+        stats = PlayerStats(
+            win_rate=stats_data.get("win_rate") or 50.0,
+            kda=stats_data.get("kda") or 2.0,
+            games_analyzed=stats_data.get("games_analyzed") or 100,
+        )
+        profile_url = data.get("profile_url") or f"https://www.op.gg/summoners/{region}/{summoner_name}"
+        country = detect_country(server=region, url=profile_url)
+
+        # La API de summary no trae champions — placeholders como en Liquipedia
+        top_champions = [
+            Champion.model_construct(name=f"Champion {i+1}", games_played=0, win_rate=0.0)
+            for i in range(3)
+        ]
+
+        return PlayerProfile(
+            nickname=data.get("nickname") or summoner_name,
+            game=GameTitle.LEAGUE_OF_LEGENDS,
+            country=country,
+            server=region.upper(),
+            rank=data.get("rank") or "Unranked",
+            stats=stats,
+            top_champions=top_champions,
+            profile_url=profile_url,
+        )
+
+    # Igual que en LiquipediaScraper: toda la extracción en un solo
+    # page.evaluate. Los selectores alternativos se prueban dentro del
+    # browser, en vez de un round-trip CDP por selector y por campo.
+    _EXTRACT_JS = """
+        () => {
+            const text = (selectors) => {
+                for (const s of selectors) {
+                    const el = document.querySelector(s);
+                    if (el && el.innerText && el.innerText.trim()) {
+                        return el.innerText.trim();
+                    }
+                }
+                return '';
+            };
+            return {
+                nickname: text(['h1', '.name', "[class*='name']", "[class*='summoner']"]),
+                rank: text(['.tier', "[class*='tier']", "[class*='rank']", '.rank']),
+                win_rate: text(['.win-rate', "[class*='winrate']", "[class*='win']"]),
+                kda: text(['.kda', "[class*='kda']"]),
+                champions: [...document.querySelectorAll('.champion-box')].slice(0, 3).map(el => ({
+                    name: el.querySelector('.champion-name')?.innerText?.trim() || '',
+                    games: el.querySelector('.games')?.innerText || '',
+                    win_rate: el.querySelector('.win-rate')?.innerText || '',
+                })),
+            };
+        }
+    """
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def scrape_player(self, summoner_name: str, region: str = "kr") -> Optional[PlayerProfile]:
         """
@@ -178,123 +376,83 @@ class OPGGScraper(BaseScraper):
         Returns:
             PlayerProfile o None
         """
+        # Primero la API JSON: <50 ms y sin los ~100 MB de un Chromium
+        profile = await self._scrape_via_json(summoner_name, region)
+        if profile:
+            return profile
+
+        logger.info(f"🔁 OP.GG JSON no disponible para {summoner_name} — usando browser")
         page = await self.create_page()
-        
+
         try:
             # Construir URL (formato actualizado 2026)
             url = f"https://www.op.gg/summoners/{region}/{summoner_name}"
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            
-            # Esperar a que cargue el contenido principal (selectores actualizados)
-            # Intentar múltiples selectores para mayor robustez
-            selectors_to_try = [
-                "h1.summoner-name",
-                ".profile-icon",
-                "[class*='summoner']",
-                "h1",
-                ".css-"
-            ]
-            
-            loaded = False
-            for selector in selectors_to_try:
-                try:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    loaded = True
-                    break
-                except:
-                    continue
-            
-            if not loaded:
+            # wait_until="commit" en vez de "domcontentloaded": OP.GG renderiza
+            # vía React, así que DOMContentLoaded solo añade espera muerta —
+            # la señal real de carga es el selector del contenido
+            await page.goto(url, wait_until="commit", timeout=15000)
+
+            # Una sola espera con los selectores combinados (coma = OR en CSS)
+            # en vez de probarlos secuencialmente a 5s de timeout cada uno
+            try:
+                await page.wait_for_selector(
+                    "h1.summoner-name, .profile-icon, [class*='summoner'], h1",
+                    state="attached",
+                    timeout=10000,
+                )
+            except PlaywrightTimeout:
                 logger.warning(f"No se pudo cargar la página de {summoner_name}")
                 return None
             
-            # Extraer nickname - intentar varios selectores
-            nickname = summoner_name
-            for selector in ["h1", ".name", "[class*='name']", "[class*='summoner']"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        if text and text.strip():
-                            nickname = text.strip()
-                            break
-                except:
-                    continue
-            
-            # Extraer rango - intentar varios selectores
+            # Un solo round-trip al browser para todos los campos
+            # (el extractor ya está registrado en el contexto)
+            extracted = await page.evaluate("window.__grExtract()")
+
+            nickname = extracted.get("nickname") or summoner_name
+
+            # Solo aceptar el texto de rango si contiene un tier conocido
             rank = "Unranked"
-            for selector in [".tier", "[class*='tier']", "[class*='rank']", ".rank"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        if text and any(r in text for r in ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Diamond", "Master", "Grandmaster", "Challenger"]):
-                            rank = text.strip()
-                            break
-                except:
-                    continue
-            
-            # Extraer win rate
+            rank_text = extracted.get("rank") or ""
+            if any(r in rank_text for r in ["Iron", "Bronze", "Silver", "Gold", "Platinum", "Diamond", "Master", "Grandmaster", "Challenger"]):
+                rank = rank_text
+
             win_rate = 50.0
-            for selector in [".win-rate", "[class*='winrate']", "[class*='win']"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        import re
-                        match = re.search(r'(\d+)%', text)
-                        if match:
-                            win_rate = float(match.group(1))
-                            break
-                except:
-                    continue
-            
-            # Extraer KDA
+            match = re.search(r'(\d+)%', extracted.get("win_rate") or "")
+            if match:
+                win_rate = float(match.group(1))
+
             kda = 2.0
-            for selector in [".kda", "[class*='kda']"]:
-                try:
-                    elem = await page.query_selector(selector)
-                    if elem:
-                        text = await elem.inner_text()
-                        import re
-                        match = re.search(r'(\d+\.?\d*)', text)
-                        if match:
-                            kda = float(match.group(1))
-                            break
-                except:
-                    continue
-            
+            match = re.search(r'(\d+\.?\d*)', extracted.get("kda") or "")
+            if match:
+                kda = float(match.group(1))
+
             # Detectar país
             country = detect_country(
                 server=region,
                 url=url
             )
-            
-            # Extraer top champions
-            champion_elements = await page.query_selector_all(".champion-box")
+
+            # Top champions (ya extraídos en el mismo evaluate)
             top_champions = []
-            
-            for i, champ_elem in enumerate(champion_elements[:3]):
-                champ_name_elem = await champ_elem.query_selector(".champion-name")
-                champ_name = await champ_name_elem.inner_text() if champ_name_elem else f"Champion {i+1}"
-                
-                games_elem = await champ_elem.query_selector(".games")
-                games_text = await games_elem.inner_text() if games_elem else "10"
-                games = int(games_text.replace("games", "").strip())
-                
-                champ_wr_elem = await champ_elem.query_selector(".win-rate")
-                champ_wr_text = await champ_wr_elem.inner_text() if champ_wr_elem else "50%"
-                champ_wr = float(champ_wr_text.replace("%", "").strip())
-                
+            for i, champ in enumerate(extracted.get("champions") or []):
+                try:
+                    games = int((champ.get("games") or "10").replace("games", "").strip())
+                except ValueError:
+                    games = 10
+                try:
+                    champ_wr = float((champ.get("win_rate") or "50%").replace("%", "").strip())
+                except ValueError:
+                    champ_wr = 50.0
+
                 top_champions.append(Champion(
-                    name=champ_name,
+                    name=champ.get("name") or f"Champion {i+1}",
                     games_played=games,
                     win_rate=champ_wr
                 ))
             
             # Si no hay suficientes champions, agregar placeholders
             while len(top_champions) < 3:
-                top_champions.append(Champion(
+                top_champions.append(Champion.model_construct(
                     name=f"Champion {len(top_champions)+1}",
                     games_played=0,
                     win_rate=0.0
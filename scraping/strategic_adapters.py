@@ -28,8 +28,9 @@ from tenacity import (
     wait_exponential,
     retry_if_exception_type
 )
-from datetime import datetime
+from datetime import datetime, timezone
 import json
+import time
 
 
 # ============================================================================
@@ -141,6 +142,41 @@ class AdvancedHeaderRotator:
         }
 
 
+class AsyncTokenBucket:
+    """
+    Token bucket asíncrono para limitar QPS de forma proactiva.
+
+    En vez de confiar en los 429 + backoff del servidor (outliers de hasta
+    30s), cada request consume un token; los tokens se reponen a la tasa
+    declarada en SourceMetadata.rate_limit_per_minute.
+    """
+
+    def __init__(self, rate_per_minute: int, capacity: Optional[int] = None):
+        self.rate = rate_per_minute / 60.0  # tokens por segundo
+        self.capacity = capacity if capacity is not None else max(1, rate_per_minute // 6)
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Espera hasta que haya un token disponible y lo consume."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                # Dormir justo lo necesario para el próximo token
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
 class ExponentialBackoffHandler:
     """Maneja backoff exponencial con jitter para evitar rate limits"""
     
@@ -189,7 +225,12 @@ class BaseStrategicAdapter(ABC):
         self.client = client
         self.metadata = metadata
         self.logger = logger.bind(source=metadata.source_name if metadata else "unknown")
-        
+
+        # Rate limiter proactivo según el límite declarado por la fuente
+        self._rate_limiter = AsyncTokenBucket(
+            metadata.rate_limit_per_minute if metadata else 30
+        )
+
         # Métricas
         self.metrics = {
             "requests": 0,
@@ -276,6 +317,7 @@ class WanplusAdapter(BaseStrategicAdapter):
         
         try:
             # Delay anti-detección
+            await self._rate_limiter.acquire()
             await ExponentialBackoffHandler.delay(RegionProfile.CHINA)
             
             headers = AdvancedHeaderRotator.get_headers(RegionProfile.CHINA)
@@ -360,7 +402,7 @@ class WanplusAdapter(BaseStrategicAdapter):
             },
             "raw_data": raw_data,  # JSONB completo
             "source": "wanplus",
-            "scraped_at": datetime.utcnow().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat()
         }
 
 
@@ -397,6 +439,7 @@ class TheEsportsClubAdapter(BaseStrategicAdapter):
         self.logger.info(f"🇮🇳 Fetching {identifier} from TEC India (game: {game})")
         
         try:
+            await self._rate_limiter.acquire()
             await ExponentialBackoffHandler.delay(RegionProfile.INDIA)
             
             headers = AdvancedHeaderRotator.get_headers(RegionProfile.INDIA)
@@ -470,7 +513,7 @@ class TheEsportsClubAdapter(BaseStrategicAdapter):
             },
             "raw_data": raw_data,
             "source": "tec_india",
-            "scraped_at": datetime.utcnow().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat()
         }
 
 
@@ -507,6 +550,7 @@ class SohaGameAdapter(BaseStrategicAdapter):
         self.logger.info(f"🇻🇳 Fetching {identifier} from Soha Game (game: {game})")
         
         try:
+            await self._rate_limiter.acquire()
             await ExponentialBackoffHandler.delay(RegionProfile.VIETNAM)
             
             headers = AdvancedHeaderRotator.get_headers(RegionProfile.VIETNAM)
@@ -581,7 +625,7 @@ class SohaGameAdapter(BaseStrategicAdapter):
             },
             "raw_data": raw_data,
             "source": "soha_game",
-            "scraped_at": datetime.utcnow().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat()
         }
 
 
@@ -628,6 +672,7 @@ class SteamWebAPIAdapter(BaseStrategicAdapter):
             return None
         
         try:
+            await self._rate_limiter.acquire()
             await ExponentialBackoffHandler.delay(RegionProfile.GLOBAL)
             
             # Convertir account ID a Steam ID64 si es necesario
@@ -722,7 +767,7 @@ class SteamWebAPIAdapter(BaseStrategicAdapter):
             },
             "raw_data": raw_data,
             "source": "steam_web_api",
-            "scraped_at": datetime.utcnow().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat()
         }
     
     def _mmr_to_rank(self, mmr: int) -> str:
@@ -776,6 +821,7 @@ class LootBetAdapter(BaseStrategicAdapter):
         self.logger.info(f"🎲 Fetching {identifier} odds from Loot.bet (game: {game})")
         
         try:
+            await self._rate_limiter.acquire()
             await ExponentialBackoffHandler.delay(RegionProfile.GLOBAL)
             
             headers = AdvancedHeaderRotator.get_headers(RegionProfile.GLOBAL)
@@ -847,7 +893,7 @@ class LootBetAdapter(BaseStrategicAdapter):
             },
             "raw_data": raw_data,
             "source": "loot_bet",
-            "scraped_at": datetime.utcnow().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat()
         }
 
 
@@ -896,6 +942,7 @@ class RiotGamesShardAdapter(BaseStrategicAdapter):
             return None
         
         try:
+            await self._rate_limiter.acquire()
             await ExponentialBackoffHandler.delay(
                 RegionProfile.KOREA if self.shard == "kr" else RegionProfile.JAPAN
             )
@@ -967,7 +1014,7 @@ class RiotGamesShardAdapter(BaseStrategicAdapter):
             },
             "raw_data": raw_data,
             "source": f"riot_api_{self.shard}",
-            "scraped_at": datetime.utcnow().isoformat()
+            "scraped_at": datetime.now(timezone.utc).isoformat()
         }
 
 
@@ -43,8 +43,9 @@ async def main() -> None:
     logger.info(f"⏰ Hora de inicio: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info("=" * 80)
 
+    # Sin pausa fija entre fases: la ingesta Bronze ya se espera con await
+    # y escribe a disco de forma síncrona, no hay nada pendiente que drenar
     await run_bronze_ingestion()
-    await asyncio.sleep(2)
     await run_ninja_scraper()
 
     end_time = datetime.now()
@@ -67,9 +67,7 @@ async def main():
         logger.error(f"Bronze Ingestion falló: {e}")
         scrapers_failed.append("Bronze Ingestion (Liquipedia)")
     
-    await asyncio.sleep(2)  # Pausa entre scrapers
-    
-    # 2. CNN Brasil Ninja scraper
+    # 2. CNN Brasil Ninja scraper (sin pausa fija: la fase anterior ya terminó)
     try:
         await run_ninja_scraper()
         scrapers_completed.append("CNN Brasil Ninja Scraper")
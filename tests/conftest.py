@@ -6,11 +6,15 @@
 import pathlib
 import sys
 
-from playwright.sync_api import Playwright, sync_playwright
 import pytest
 
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
 
+# El loop compartido de la sesión se configura en pytest.ini
+# (asyncio_default_*_loop_scope = session); pytest-asyncio >= 1.0 ignora
+# un override del fixture event_loop aquí.
+
+
 def pytest_configure(config):
     """Configuración global de pytest para Playwright"""
     config.addinivalue_line(
@@ -0,0 +1,24 @@
+"""
+Verifica que pytest-asyncio comparte un único event loop por sesión
+(asyncio_default_test_loop_scope = session en pytest.ini)
+"""
+import asyncio
+
+import pytest
+
+# Los dos tests corren en orden de archivo; el segundo compara su loop
+# con el que vio el primero
+_seen_loops = []
+
+
+@pytest.mark.asyncio
+async def test_loop_de_sesion_primer_test():
+    _seen_loops.append(asyncio.get_running_loop())
+
+
+@pytest.mark.asyncio
+async def test_loop_de_sesion_compartido():
+    _seen_loops.append(asyncio.get_running_loop())
+    assert _seen_loops[0] is _seen_loops[1], (
+        "los tests asyncio no comparten el event loop de sesión"
+    )
@@ -4,20 +4,20 @@ Demuestra el uso de Dak.gg y ScoreGG scrapers
 """
 import asyncio
 from loguru import logger
-from scraping.regional_connectors import (
-    DakGGConnector,
-    ScoreGGConnector,
-    scrape_dak_gg_players,
-    scrape_scoregg_players
-)
+
+# Los imports de scraping.regional_connectors (que arrastran Playwright) van
+# dentro de cada test: así `pytest -k country` no paga el costo de importar
+# el browser stack durante la colección
 
 
 async def test_dak_gg():
     """Prueba del conector Dak.gg (Corea)"""
+    from scraping.regional_connectors import DakGGConnector
+
     logger.info("="*80)
     logger.info("🧪 TEST: DAK.GG CONNECTOR (KOREA)")
     logger.info("="*80)
-    
+
     # Test individual
     async with DakGGConnector() as connector:
         # Probar con un jugador
@@ -41,6 +41,8 @@ async def test_dak_gg():
 
 async def test_scoregg():
     """Prueba del conector ScoreGG (China)"""
+    from scraping.regional_connectors import ScoreGGConnector
+
     logger.info("="*80)
     logger.info("🧪 TEST: SCOREGG CONNECTOR (CHINA)")
     logger.info("="*80)
@@ -68,6 +70,8 @@ async def test_scoregg():
 
 async def test_batch_scraping():
     """Prueba de scraping en batch"""
+    from scraping.regional_connectors import scrape_dak_gg_players
+
     logger.info("="*80)
     logger.info("🧪 TEST: BATCH SCRAPING")
     logger.info("="*80)
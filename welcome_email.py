@@ -165,6 +165,36 @@ def _build_context(
 # SECTION 2 — HTML RENDERER
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Compiled template cached across calls — building the Environment and
+# parsing the template is the expensive part of a render; registration
+# bursts reuse the same compiled template
+_template = None
+
+
+def _get_template():
+    """Return the compiled welcome template, building it on first use."""
+    global _template
+    if _template is not None:
+        return _template
+
+    if not JINJA2_OK:
+        raise RuntimeError("Jinja2 is not installed.  Run: pip install jinja2")
+
+    template_path = TEMPLATE_DIR / TEMPLATE_FILE
+    if not template_path.exists():
+        raise RuntimeError(
+            f"Template not found: {template_path}\n"
+            f"  Ensure {TEMPLATE_FILE} exists in {TEMPLATE_DIR}"
+        )
+
+    env = Environment(
+        loader     = FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape = select_autoescape(["html"]),
+    )
+    _template = env.get_template(TEMPLATE_FILE)
+    return _template
+
+
 def render_welcome_email(
     user_name:     str,
     user_email:    str,
@@ -196,21 +226,7 @@ def render_welcome_email(
     ------
     RuntimeError  : If Jinja2 is not installed or the template file is missing.
     """
-    if not JINJA2_OK:
-        raise RuntimeError("Jinja2 is not installed.  Run: pip install jinja2")
-
-    template_path = TEMPLATE_DIR / TEMPLATE_FILE
-    if not template_path.exists():
-        raise RuntimeError(
-            f"Template not found: {template_path}\n"
-            f"  Ensure {TEMPLATE_FILE} exists in {TEMPLATE_DIR}"
-        )
-
-    env = Environment(
-        loader     = FileSystemLoader(str(TEMPLATE_DIR)),
-        autoescape = select_autoescape(["html"]),
-    )
-    template = env.get_template(TEMPLATE_FILE)
+    template = _get_template()
 
     context = _build_context(
         user_name     = user_name,